@@ -22,7 +22,7 @@ try:
 except ImportError:  # pragma: no cover - fallback for direct script execution
     from simplify_ipc_global_areas import simplify_topojson
 
-from rosea_ipc_toolkit.feature_utils import feature_key
+from rosea_ipc_toolkit.feature_utils import feature_key, strip_cached_keys
 from rosea_ipc_toolkit.topology import (
     convert_geojson_to_topology,
     display_relative,
@@ -53,7 +53,7 @@ def collect_all_features(files: Iterable[Path]) -> List[Dict[str, Any]]:
                 aggregate[key] = feature
 
     sorted_items = sorted(aggregate.items(), key=lambda item: item[0])
-    return [item[1] for item in sorted_items]
+    return strip_cached_keys([item[1] for item in sorted_items])
 
 
 def discover_topojson_files(skip_path: Path, *, include_per_year: bool) -> List[Path]:
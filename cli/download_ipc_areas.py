@@ -58,13 +58,35 @@ def parse_cli_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         "--retry-delay",
         type=float,
         default=0.5,
-        help="Delay in seconds after a failed year fetch before retrying the next (default: 0.5)",
+        help="Base delay in seconds for exponential backoff between retries (default: 0.5)",
     )
     parser.add_argument(
         "--rate-limit-delay",
         type=float,
-        default=1.0,
-        help="Delay in seconds between countries to respect IPC rate limits (default: 1.0)",
+        default=0.5,
+        help="Minimum seconds between request starts when downloading sequentially (default: 0.5)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Concurrent IPC API requests when aiohttp is installed; 1 downloads sequentially (default: 8)",
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=4.0,
+        help="Upper bound on concurrent request starts per second (default: 4.0)",
+    )
+    parser.add_argument(
+        "--year-batching",
+        action="store_true",
+        help="Fetch all assessment years per country in one request when a probe shows the API honours year lists",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes used to build country datasets after concurrent downloads (default: CPU count; 1 disables)",
     )
     parser.add_argument(
         "--skip-index",
@@ -97,6 +119,10 @@ def main(argv: Optional[List[str]] = None) -> int:
         request_timeout=args.request_timeout,
         retry_delay=args.retry_delay,
         rate_limit_delay=args.rate_limit_delay,
+        concurrency=args.concurrency,
+        requests_per_second=args.requests_per_second,
+        workers=args.workers,
+        batch_years=args.year_batching,
         country_codes=args.countries,
         build_index=False if extra_global_only else not args.skip_index,
         extra_global_simplification=args.extra_global_simplification or extra_global_only,
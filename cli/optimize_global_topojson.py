@@ -20,7 +20,6 @@ the original artefact is kept for comparison.
 from __future__ import annotations
 
 import argparse
-import json
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
@@ -30,14 +29,15 @@ try:  # allow execution via `python cli/optimize_global_topojson.py`
 except ImportError:  # pragma: no cover - fallback when not running as package
     from simplify_ipc_global_areas import simplify_topojson
 
+from rosea_ipc_toolkit.topology import read_json
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_INPUT = REPO_ROOT / "data" / "global_areas.topojson"
 DEFAULT_OUTPUT = REPO_ROOT / "data" / "global_areas_optimized_plus.topojson"
 
 
 def load_geometries(topo_path: Path) -> List[Dict]:
-    with topo_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = read_json(topo_path)
 
     objects = payload.get("objects")
     if not isinstance(objects, dict) or not objects:
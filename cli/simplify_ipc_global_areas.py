@@ -3,22 +3,37 @@
 
 Reads a TopoJSON file, rounds geometry coordinates to a configurable precision,
 optionally simplifies geometries, converts the result back to TopoJSON, and writes
-an updated dataset alongside a size report. Helper functions can be imported by
-other scripts (e.g., the combiner) to reuse the logic programmatically.
+an updated dataset alongside a size report. ``--arc-level`` instead simplifies
+the shared arcs in place without rebuilding the topology, which is much faster
+but keeps near-coincident borders as separate arcs. Helper
+functions can be imported by other scripts (e.g., the combiner) to reuse the
+logic programmatically.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import math
+import os
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from rosea_ipc_toolkit.topology import load_topojson_features
+from rosea_ipc_toolkit._fast import round_arcs, round_coords
+from rosea_ipc_toolkit.topology import (
+    decode_arcs,
+    encode_arcs,
+    iter_arc_indices,
+    load_topojson_features,
+    read_json,
+    write_json,
+)
 
 try:
+    import numpy as np
     import topojson as tp
 except ImportError as exc:  # pragma: no cover - the script exits immediately
     raise SystemExit(
@@ -26,15 +41,20 @@ except ImportError as exc:  # pragma: no cover - the script exits immediately
     ) from exc
 
 try:
-    from shapely.geometry import shape
+    import shapely
+    from shapely.geometry import mapping, shape
     from shapely.geometry.base import BaseGeometry
 except ImportError:  # pragma: no cover - simplification is optional
+    shapely = None  # type: ignore[assignment]
+    mapping = None  # type: ignore[assignment]
     shape = None  # type: ignore[assignment]
     BaseGeometry = object  # type: ignore[assignment]
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = REPO_ROOT / "data"
 DEFAULT_SOURCE_NAME = "ipc_global_areas.topojson"
+# Below this many features the process pool start-up outweighs the gain.
+PARALLEL_MIN_FEATURES = 200
 
 
 def ensure_source(path: Path) -> None:
@@ -46,18 +66,90 @@ def load_global_features(source: Path) -> List[Dict[str, Any]]:
     return load_topojson_features(source)
 
 
+_SEQUENCE_TYPES = (list, tuple)
+
+
 def round_nested(value: Any, digits: int) -> Any:
-    if isinstance(value, list):
-        return [round_nested(item, digits) for item in value]
-    if isinstance(value, float):
-        return round(value, digits)
-    return value
+    """Round every float in arbitrarily nested sequences.
+
+    Walks with an explicit stack instead of recursing, and rounds each flat
+    sequence (a position) in a single comprehension. Shapely mappings use
+    tuples; rounding always emits lists.
+    """
+
+    if not isinstance(value, _SEQUENCE_TYPES):
+        return round(value, digits) if isinstance(value, float) else value
+
+    root: List[Any] = []
+    stack = [(value, root)]
+    while stack:
+        source, target = stack.pop()
+        for item in source:
+            if isinstance(item, _SEQUENCE_TYPES):
+                if item and not any(isinstance(member, _SEQUENCE_TYPES) for member in item):
+                    target.append([round(x, digits) if isinstance(x, float) else x for x in item])
+                else:
+                    child: List[Any] = []
+                    target.append(child)
+                    stack.append((item, child))
+            elif isinstance(item, float):
+                target.append(round(item, digits))
+            else:
+                target.append(item)
+    return root
+
+
+def _only_floats(coords: Any) -> bool:
+    # A position or a flat list of positions whose values are all floats.
+    if not isinstance(coords, _SEQUENCE_TYPES) or not coords:
+        return False
+    values = chain.from_iterable(coords) if isinstance(coords[0], _SEQUENCE_TYPES) else coords
+    try:
+        return set(map(type, values)) == {float}
+    except TypeError:
+        return False
+
+
+def _round_array(coords: Any, digits: int) -> Any:
+    # NumPy would turn ints into floats and None into NaN, so anything but
+    # all-float input keeps the generic walker's behaviour.
+    if not _only_floats(coords):
+        return round_nested(coords, digits)
+    try:
+        array = np.asarray(coords, dtype=np.float64)
+    except ValueError:
+        # Ragged positions.
+        return round_nested(coords, digits)
+    return round_coords(array, digits).tolist()
+
+
+def round_coordinates(geometry_type: Optional[str], coords: Any, digits: int) -> Any:
+    """Round coordinates by rounding each homogeneous array in one NumPy call."""
+
+    if geometry_type in {"Point", "MultiPoint", "LineString"}:
+        return _round_array(coords, digits)
+    if geometry_type in {"MultiLineString", "Polygon"} and isinstance(coords, (list, tuple)):
+        return [_round_array(part, digits) for part in coords]
+    if geometry_type == "MultiPolygon" and isinstance(coords, (list, tuple)):
+        return [
+            [_round_array(ring, digits) for ring in polygon]
+            if isinstance(polygon, (list, tuple))
+            else round_nested(polygon, digits)
+            for polygon in coords
+        ]
+    return round_nested(coords, digits)
 
 
 FailureRecord = Dict[str, Any]
 
 
 def simplify_geometry(geometry: Dict[str, Any], tolerance: float) -> Tuple[Dict[str, Any], Optional[FailureRecord]]:
+    """Simplify a GeoJSON geometry, reporting why the original was kept if it was.
+
+    Simplification only ever drops vertices, so an unchanged vertex count is
+    treated as "no change".
+    """
+
     if tolerance <= 0:
         return geometry, None
 
@@ -82,12 +174,84 @@ def simplify_geometry(geometry: Dict[str, Any], tolerance: float) -> Tuple[Dict[
         return geometry, {"reason": "empty_geometry", "detail": "Simplification produced an empty geometry"}
 
     try:
-        if simplified.equals(geom_obj):
+        if hasattr(shapely, "get_num_coordinates"):
+            unchanged = shapely.get_num_coordinates(simplified) == shapely.get_num_coordinates(geom_obj)
+        else:
+            unchanged = simplified.equals(geom_obj)
+        if unchanged:
             return geometry, {"reason": "no_change", "detail": "Simplified geometry matches original"}
     except Exception as exc:  # noqa: BLE001
         return geometry, {"reason": "comparison_failed", "detail": str(exc)}
 
-    return json.loads(json.dumps(simplified.__geo_interface__)), None
+    return mapping(simplified), None
+
+
+def simplify_geometries(
+    geometries: List[Dict[str, Any]],
+    tolerance: float,
+) -> List[Tuple[Dict[str, Any], Optional[FailureRecord]]]:
+    """Batch counterpart of :func:`simplify_geometry` using Shapely 2 array ops."""
+
+    if tolerance <= 0 or shape is None or not hasattr(shapely, "simplify"):
+        return [simplify_geometry(geometry, tolerance) for geometry in geometries]
+
+    results: List[Any] = [None] * len(geometries)
+    indices: List[int] = []
+    objects: List[BaseGeometry] = []
+    for index, geometry in enumerate(geometries):
+        try:
+            objects.append(shape(geometry))  # type: ignore[arg-type]
+        except Exception as exc:  # noqa: BLE001
+            results[index] = (geometry, {"reason": "invalid_geometry", "detail": str(exc)})
+            continue
+        indices.append(index)
+
+    if not objects:
+        return results
+
+    originals = np.empty(len(objects), dtype=object)
+    originals[:] = objects
+    try:
+        simplified = shapely.simplify(originals, tolerance, preserve_topology=True)
+        empty = shapely.is_empty(simplified)
+        unchanged = shapely.get_num_coordinates(simplified) == shapely.get_num_coordinates(originals)
+    except Exception:  # noqa: BLE001
+        # A single bad geometry fails the whole batch; classify one by one.
+        for index in indices:
+            results[index] = simplify_geometry(geometries[index], tolerance)
+        return results
+
+    for position, index in enumerate(indices):
+        geometry = geometries[index]
+        if empty[position]:
+            results[index] = (
+                geometry,
+                {"reason": "empty_geometry", "detail": "Simplification produced an empty geometry"},
+            )
+        elif unchanged[position]:
+            results[index] = (
+                geometry,
+                {"reason": "no_change", "detail": "Simplified geometry matches original"},
+            )
+        else:
+            results[index] = (mapping(simplified[position]), None)
+
+    return results
+
+
+def _rebuild_feature(feature: Dict[str, Any], geometry: Any, digits: Optional[int]) -> Dict[str, Any]:
+    # Build a new outer dict around the (possibly new) geometry. Properties and
+    # untouched geometries are shared with the input, which is never mutated;
+    # rounding rebuilds coordinate lists. ``digits=None`` skips rounding.
+    if isinstance(geometry, dict) and digits is not None and "coordinates" in geometry:
+        geometry = {
+            **geometry,
+            "coordinates": round_coordinates(geometry.get("type"), geometry["coordinates"], digits),
+        }
+    rebuilt = {**feature, "properties": feature.get("properties") or {}}
+    if isinstance(geometry, dict):
+        rebuilt["geometry"] = geometry
+    return rebuilt
 
 
 def simplify_feature(
@@ -95,33 +259,265 @@ def simplify_feature(
     digits: int,
     tolerance: float,
 ) -> Tuple[Dict[str, Any], Optional[FailureRecord]]:
-    feature_copy = json.loads(json.dumps(feature))  # deep copy to avoid mutating original
-    geometry = feature_copy.get("geometry")
+    geometry = feature.get("geometry")
     failure: Optional[FailureRecord] = None
-    if isinstance(geometry, dict):
-        if tolerance > 0:
-            geometry, failure = simplify_geometry(geometry, tolerance)
-            feature_copy["geometry"] = geometry
-        if "coordinates" in geometry:
-            geometry["coordinates"] = round_nested(geometry["coordinates"], digits)
-    return feature_copy, failure
+    if isinstance(geometry, dict) and tolerance > 0:
+        geometry, failure = simplify_geometry(geometry, tolerance)
+    return _rebuild_feature(feature, geometry, digits), failure
+
+
+def quantization_steps(extent: float, precision: int) -> int:
+    """Grid steps across ``extent`` whose spacing is at most ``10 ** -precision``.
+
+    Snapping to such a grid is as accurate as rounding to ``precision``
+    decimals, so quantized output needs no separate rounding pass.
+    """
+
+    return max(int(math.ceil(extent * 10**precision)) + 1, 2)
 
 
-def build_topology(features: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _iter_position_lists(geom_type: Any, coords: Any) -> Any:
+    if geom_type == "Point":
+        yield [coords]
+    elif geom_type in {"MultiPoint", "LineString"}:
+        yield coords
+    elif geom_type in {"MultiLineString", "Polygon"}:
+        yield from coords
+    elif geom_type == "MultiPolygon":
+        for polygon in coords:
+            yield from polygon
+
+
+def _feature_extent(features: List[Dict[str, Any]]) -> Optional[float]:
+    lower = np.full(2, np.inf)
+    upper = np.full(2, -np.inf)
+    for feature in features:
+        geometry = feature.get("geometry")
+        if not isinstance(geometry, dict):
+            continue
+        members = geometry.get("geometries") if geometry.get("type") == "GeometryCollection" else [geometry]
+        for member in members or []:
+            if not isinstance(member, dict) or not member.get("coordinates"):
+                continue
+            for positions in _iter_position_lists(member.get("type"), member["coordinates"]):
+                if not positions:
+                    continue
+                try:
+                    points = np.asarray([position[:2] for position in positions], dtype=np.float64)
+                except (TypeError, ValueError):
+                    return None
+                lower = np.minimum(lower, points.min(axis=0))
+                upper = np.maximum(upper, points.max(axis=0))
+    if not np.isfinite(lower).all():
+        return None
+    return float((upper - lower).max())
+
+
+def build_topology(
+    features: List[Dict[str, Any]],
+    *,
+    precision: int = 4,
+    prequantize: Optional[int] | bool = None,
+) -> Dict[str, Any]:
+    """Build a TopoJSON dictionary from features.
+
+    Coordinates are snapped to an integer grid before arc detection, which is
+    considerably faster and writes delta-encoded arcs with a ``transform``.
+    By default the grid is as fine as ``precision`` decimals require (see
+    ``quantization_steps``), so features need not be rounded beforehand;
+    pass ``prequantize=False`` to keep exact coordinates.
+    """
+
+    if prequantize is None:
+        extent = _feature_extent(features)
+        prequantize = (
+            quantization_steps(extent, precision)
+            if extent is not None and precision >= 0
+            else 10 ** max(precision + 2, 6)
+        )
+
     feature_collection = {
         "type": "FeatureCollection",
         "features": features,
     }
-    topology = tp.Topology(feature_collection, prequantize=False)
+    topology = tp.Topology(feature_collection, prequantize=prequantize, shared_coords=False)
     result = topology.to_dict()
     result.setdefault("arcs", [])
     return result
 
 
+def _iter_rings(geometry: Dict[str, Any]) -> Any:
+    geom_type = geometry.get("type")
+    if geom_type == "Polygon":
+        yield from geometry.get("arcs") or []
+    elif geom_type == "MultiPolygon":
+        for polygon in geometry.get("arcs") or []:
+            yield from polygon
+    elif geom_type == "GeometryCollection":
+        for member in geometry.get("geometries") or []:
+            if isinstance(member, dict):
+                yield from _iter_rings(member)
+
+
+def _iter_object_geometries(topology: Dict[str, Any]) -> Any:
+    objects = topology.get("objects")
+    if not isinstance(objects, dict):
+        return
+    for obj in objects.values():
+        geometries = obj.get("geometries") if isinstance(obj, dict) else None
+        if isinstance(geometries, list):
+            yield from (geometry for geometry in geometries if isinstance(geometry, dict))
+
+
+def _simplify_arc_arrays(
+    arcs: List[np.ndarray],
+    tolerance: float,
+    geometries: List[Dict[str, Any]],
+) -> Tuple[List[np.ndarray], set[int]]:
+    candidates = [index for index, arc in enumerate(arcs) if len(arc) > 2]
+    if not candidates:
+        return arcs, set()
+
+    lengths = np.array([len(arcs[index]) for index in candidates])
+    lines = shapely.linestrings(
+        np.concatenate([arcs[index][:, :2] for index in candidates]),
+        indices=np.repeat(np.arange(len(candidates)), lengths),
+    )
+    simplified = shapely.simplify(lines, tolerance, preserve_topology=True)
+    counts = shapely.get_num_coordinates(simplified)
+    points = np.split(shapely.get_coordinates(simplified), np.cumsum(counts)[:-1])
+
+    result = list(arcs)
+    changed: set[int] = set()
+    for index, length, count, arc_points in zip(candidates, lengths, counts, points):
+        if count == length:
+            continue
+        closed = bool(np.array_equal(arcs[index][0], arcs[index][-1]))
+        if count < (4 if closed else 2):
+            continue
+        result[index] = arc_points
+        changed.add(index)
+
+    # A ring split across several arcs can still collapse below four points.
+    for geometry in geometries:
+        for ring in _iter_rings(geometry):
+            members = list(iter_arc_indices(ring))
+            if sum(len(result[index]) - 1 for index in members) + 1 >= 4:
+                continue
+            for index in members:
+                result[index] = arcs[index]
+                changed.discard(index)
+
+    return result, changed
+
+
+def simplify_arcs(
+    topology: Dict[str, Any],
+    *,
+    precision: int,
+    simplify_tolerance: float,
+    quantize: bool = False,
+) -> set[int]:
+    """Simplify and round a topology's shared arcs in place, keeping ``objects``.
+
+    Each arc is simplified once however many features share it, so borders
+    stay coincident and the topology never needs rebuilding. Closed arcs keep
+    at least four points and rings that would collapse keep their original
+    arcs. Quantized input is re-encoded onto its existing ``transform``;
+    unquantized input is quantized onto a ``precision``-sized grid over its
+    extent (as ``build_topology`` does) when ``quantize`` is set.
+    Returns the indices of arcs that changed; raises ``ValueError`` when the
+    arcs cannot be handled as homogeneous arrays.
+    """
+
+    arcs = decode_arcs(topology)
+    if len({arc.shape[1] for arc in arcs if len(arc)}) > 1:
+        raise ValueError("Arc positions must share the same dimensions")
+    geometries = list(_iter_object_geometries(topology))
+    changed: set[int] = set()
+    if simplify_tolerance > 0:
+        arcs, changed = _simplify_arc_arrays(arcs, simplify_tolerance, geometries)
+
+    rounded = round_arcs(arcs, precision, as_arrays=True)
+    if rounded is None:
+        raise ValueError("Arc positions must share the same dimensions")
+
+    transform = topology.get("transform")
+    if isinstance(transform, dict):
+        topology["arcs"] = encode_arcs(rounded, transform)
+        return changed
+
+    # Unquantized point geometries carry absolute coordinates of their own.
+    points = [
+        geometry
+        for geometry in geometries
+        if geometry.get("type") in {"Point", "MultiPoint"} and "coordinates" in geometry
+    ]
+    for geometry in points:
+        geometry["coordinates"] = round_coordinates(
+            geometry["type"], geometry["coordinates"], precision
+        )
+
+    transform = _grid_transform(rounded, points, precision) if quantize else None
+    if transform is None:
+        topology["arcs"] = [arc.tolist() for arc in rounded]
+        return changed
+
+    scale = np.asarray(transform["scale"])
+    translate = np.asarray(transform["translate"])
+    for geometry in points:
+        coords = np.asarray(geometry["coordinates"], dtype=np.float64)[..., :2]
+        geometry["coordinates"] = np.rint((coords - translate) / scale).astype(np.int64).tolist()
+    topology["arcs"] = encode_arcs(rounded, transform)
+    topology["transform"] = transform
+    return changed
+
+
+def _grid_transform(
+    arcs: List[np.ndarray],
+    points: List[Dict[str, Any]],
+    precision: int,
+) -> Optional[Dict[str, List[float]]]:
+    chunks = [arc[:, :2] for arc in arcs if len(arc)]
+    for geometry in points:
+        coords = np.asarray(geometry["coordinates"], dtype=np.float64)
+        if coords.size:
+            chunks.append(coords.reshape(-1, coords.shape[-1])[:, :2])
+    if not chunks:
+        return None
+
+    stacked = np.concatenate(chunks)
+    lower = stacked.min(axis=0)
+    extent = stacked.max(axis=0) - lower
+    steps = quantization_steps(float(extent.max()), precision)
+    scale = np.where(extent > 0, extent / (steps - 1), 1.0)
+    return {"scale": scale.tolist(), "translate": lower.tolist()}
+
+
+def _arc_failures(
+    topology: Dict[str, Any],
+    changed: set[int],
+    source: Path,
+) -> List[FailureRecord]:
+    failures: List[FailureRecord] = []
+    for geometry in _iter_object_geometries(topology):
+        members = set(iter_arc_indices(geometry.get("arcs")))
+        for member in geometry.get("geometries") or []:
+            if isinstance(member, dict):
+                members.update(iter_arc_indices(member.get("arcs")))
+        if members and members.isdisjoint(changed):
+            failures.append(
+                _build_failure_entry(
+                    geometry,
+                    {"reason": "no_change", "detail": "Simplified geometry matches original"},
+                    source,
+                )
+            )
+    return failures
+
+
 def write_output(target: Path, topology: Dict[str, Any]) -> None:
-    target.parent.mkdir(exist_ok=True)
-    with open(target, "w", encoding="utf-8") as handle:
-        json.dump(topology, handle, separators=(",", ":"))
+    write_json(target, topology)
 
 
 def _build_failure_entry(
@@ -151,25 +547,70 @@ def _build_failure_entry(
     return entry
 
 
-def simplify_features(
+def _simplify_chunk(
     features: List[Dict[str, Any]],
-    *,
-    precision: int,
+    precision: Optional[int],
     simplify_tolerance: float,
     source: Path,
 ) -> Tuple[List[Dict[str, Any]], List[FailureRecord]]:
+    geometries = [feature.get("geometry") for feature in features]
+    outcomes: List[Tuple[Any, Optional[FailureRecord]]] = [(geometry, None) for geometry in geometries]
+    if simplify_tolerance > 0:
+        indices = [index for index, geometry in enumerate(geometries) if isinstance(geometry, dict)]
+        batch = simplify_geometries([geometries[index] for index in indices], simplify_tolerance)
+        for index, outcome in zip(indices, batch):
+            outcomes[index] = outcome
+
     simplified: List[Dict[str, Any]] = []
     failures: List[FailureRecord] = []
 
-    for feature in features:
-        simplified_feature, failure = simplify_feature(feature, precision, simplify_tolerance)
-        simplified.append(simplified_feature)
+    for feature, (geometry, failure) in zip(features, outcomes):
+        simplified.append(_rebuild_feature(feature, geometry, precision))
         if failure:
             failures.append(_build_failure_entry(feature, failure, source))
 
     return simplified, failures
 
 
+def simplify_features(
+    features: List[Dict[str, Any]],
+    *,
+    precision: Optional[int],
+    simplify_tolerance: float,
+    source: Path,
+    jobs: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], List[FailureRecord]]:
+    """Simplify features, spreading large collections across worker processes.
+
+    Coordinates are rounded to ``precision`` decimals unless it is ``None``.
+    ``jobs`` defaults to the CPU count; pass ``1`` to stay in-process.
+    """
+
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    workers = min(max(workers, 1), len(features) or 1)
+    if workers == 1 or len(features) <= PARALLEL_MIN_FEATURES:
+        return _simplify_chunk(features, precision, simplify_tolerance, source)
+
+    chunk_size = -(-len(features) // workers)
+    chunks = [features[start : start + chunk_size] for start in range(0, len(features), chunk_size)]
+
+    simplified: List[Dict[str, Any]] = []
+    failures: List[FailureRecord] = []
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        results = executor.map(
+            _simplify_chunk,
+            chunks,
+            [precision] * len(chunks),
+            [simplify_tolerance] * len(chunks),
+            [source] * len(chunks),
+        )
+        for chunk_simplified, chunk_failures in results:
+            simplified.extend(chunk_simplified)
+            failures.extend(chunk_failures)
+
+    return simplified, failures
+
+
 def _write_unsimplified_report(target: Path, failures: List[FailureRecord], quiet: bool) -> None:
     report_path = target.with_name(target.stem + "_unsimplified.json")
 
@@ -186,15 +627,13 @@ def _write_unsimplified_report(target: Path, failures: List[FailureRecord], quie
         target_display = target.as_posix()
 
     payload = {
-        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
         "source_file": target_display,
         "total_unsimplified": len(failures),
         "items": failures,
     }
 
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    with report_path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+    write_json(report_path, payload, indent=True)
 
     if not quiet:
         print(
@@ -210,20 +649,57 @@ def simplify_topojson(
     precision: int = 4,
     simplify_tolerance: float = 0.0,
     quiet: bool = False,
+    jobs: Optional[int] = None,
+    arc_level: bool = False,
 ) -> Dict[str, int | float]:
+    """Simplify ``source`` and write the result to ``output`` (default: in place).
+
+    Features are decoded, simplified individually, and rebuilt into a new
+    topology, which re-detects shared borders (and merges near-coincident ones
+    after rounding). ``arc_level`` simplifies the existing arcs in place
+    instead; ``jobs`` only applies to the per-feature path.
+    """
+
     ensure_source(source)
 
-    features = load_global_features(source)
-    if not features:
-        raise ValueError("No features available to simplify")
+    topology: Optional[Dict[str, Any]] = None
+    failures: List[FailureRecord] = []
 
-    processed, failures = simplify_features(
-        features,
-        precision=precision,
-        simplify_tolerance=simplify_tolerance,
-        source=source,
-    )
-    topology = build_topology(processed)
+    # Arc-level simplification needs the Shapely 2 array API; without it (or
+    # for payloads that are not plain topologies) use the per-feature path.
+    if arc_level and (simplify_tolerance <= 0 or (shape is not None and hasattr(shapely, "simplify"))):
+        payload = read_json(source)
+        if isinstance(payload, dict) and payload.get("type") == "Topology":
+            if not any(True for _ in _iter_object_geometries(payload)):
+                raise ValueError("No features available to simplify")
+            try:
+                changed = simplify_arcs(
+                    payload,
+                    precision=precision,
+                    simplify_tolerance=simplify_tolerance,
+                    quantize=precision >= 0,
+                )
+            except ValueError:
+                pass
+            else:
+                topology = payload
+                if simplify_tolerance > 0:
+                    failures = _arc_failures(topology, changed, source)
+
+    if topology is None:
+        features = load_global_features(source)
+        if not features:
+            raise ValueError("No features available to simplify")
+
+        # build_topology quantizes to ``precision``, so skip explicit rounding.
+        processed, failures = simplify_features(
+            features,
+            precision=None if precision >= 0 else precision,
+            simplify_tolerance=simplify_tolerance,
+            source=source,
+            jobs=jobs,
+        )
+        topology = build_topology(processed, precision=precision)
 
     target = output or source
     write_output(target, topology)
@@ -266,6 +742,8 @@ def minify_topojson(
     precision: int = 4,
     simplify_tolerance: float = 0.0,
     quiet: bool = False,
+    jobs: Optional[int] = None,
+    arc_level: bool = False,
 ) -> Dict[str, int | float]:
     """Backward compatible alias for the previous function name."""
 
@@ -275,6 +753,8 @@ def minify_topojson(
         precision=precision,
         simplify_tolerance=simplify_tolerance,
         quiet=quiet,
+        jobs=jobs,
+        arc_level=arc_level,
     )
 
 
@@ -304,6 +784,17 @@ def main(argv: List[str] | None = None) -> int:
         default=0.001,
         help="Simplification tolerance in coordinate units; set to 0 to disable",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes used for per-feature simplification (default: CPU count; 1 disables)",
+    )
+    parser.add_argument(
+        "--arc-level",
+        action="store_true",
+        help="Simplify the shared arcs in place instead of rebuilding the topology (faster, larger output)",
+    )
     args = parser.parse_args(argv)
 
     try:
@@ -313,6 +804,8 @@ def main(argv: List[str] | None = None) -> int:
             precision=args.precision,
             simplify_tolerance=args.simplify_tolerance,
             quiet=False,
+            jobs=args.jobs,
+            arc_level=args.arc_level,
         )
     except FileNotFoundError as exc:
         print(str(exc), file=sys.stderr)
@@ -0,0 +1,80 @@
+"""Vectorised coordinate kernels, JIT-compiled with Numba when it is installed."""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    numba = None  # type: ignore[assignment]
+
+HAS_NUMBA = numba is not None
+
+if HAS_NUMBA:
+
+    @numba.njit(cache=True, parallel=True)
+    def _round_flat(values: np.ndarray, factor: float) -> np.ndarray:  # pragma: no cover - compiled
+        out = np.empty_like(values)
+        for index in numba.prange(values.size):
+            out[index] = np.rint(values[index] * factor) / factor
+        return out
+
+
+def round_coords(array: np.ndarray, digits: int) -> np.ndarray:
+    """Round a float64 coordinate array to ``digits`` decimals.
+
+    Matches ``np.round`` (scale, round half to even, unscale); the compiled
+    kernel is used for non-negative ``digits`` when Numba is available.
+    """
+
+    if not HAS_NUMBA or digits < 0:
+        return np.round(array, digits)
+
+    values = np.ascontiguousarray(array, dtype=np.float64)
+    return _round_flat(values.ravel(), 10.0**digits).reshape(values.shape)
+
+
+def round_arcs(
+    arcs: Sequence[Any],
+    digits: int,
+    *,
+    as_arrays: bool = False,
+) -> Optional[List[Any]]:
+    """Round every TopoJSON arc with a single kernel call.
+
+    Arcs (nested lists or ``(n, dims)`` arrays) are flattened into one array,
+    rounded, and split back per arc — as lists, or as array views when
+    ``as_arrays`` is set. Returns ``None`` when the points are ragged (mixed
+    dimensions) so callers can fall back to a generic walker. Only use on
+    absolute coordinates, never on delta-encoded quantized arcs.
+    """
+
+    lengths = [len(arc) for arc in arcs]
+    if not any(lengths):
+        return [np.empty((0, 2)) if as_arrays else [] for _ in lengths]
+
+    try:
+        if all(isinstance(arc, np.ndarray) for arc in arcs):
+            array = np.concatenate([arc for arc in arcs if len(arc)]).astype(np.float64, copy=False)
+        else:
+            array = np.asarray(list(chain.from_iterable(arcs)), dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    if array.ndim != 2:
+        return None
+
+    rounded_array = round_coords(array, digits)
+    if as_arrays:
+        return np.split(rounded_array, np.cumsum(lengths)[:-1])
+
+    flat = rounded_array.tolist()
+    rounded: List[List[List[float]]] = []
+    start = 0
+    for length in lengths:
+        rounded.append(flat[start : start + length])
+        start += length
+    return rounded
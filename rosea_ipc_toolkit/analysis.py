@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .dates import (
@@ -19,16 +19,26 @@ from .dates import (
 Feature = Dict[str, Any]
 AnalysisBucket = Dict[str, Any]
 
+_MIN_DT = datetime.min
 
-def _initial_bucket(props: Dict[str, Any]) -> AnalysisBucket:
+_METADATA_FIELDS = (
+    ("analysis_id", ANALYSIS_ID_KEYS),
+    ("analysis_label", ANALYSIS_LABEL_KEYS),
+    ("from_raw", DATE_FROM_KEYS),
+    ("to_raw", DATE_TO_KEYS),
+    ("updated_raw", DATE_UPDATED_KEYS),
+    ("published_raw", DATE_PUBLISHED_KEYS),
+)
+
+
+def _extract_metadata(props: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: first_present(props, keys) for field, keys in _METADATA_FIELDS}
+
+
+def _initial_bucket(metadata: Dict[str, Any]) -> AnalysisBucket:
     return {
         "features": [],
-        "analysis_id": first_present(props, ANALYSIS_ID_KEYS),
-        "analysis_label": first_present(props, ANALYSIS_LABEL_KEYS),
-        "from_raw": first_present(props, DATE_FROM_KEYS),
-        "to_raw": first_present(props, DATE_TO_KEYS),
-        "updated_raw": first_present(props, DATE_UPDATED_KEYS),
-        "published_raw": first_present(props, DATE_PUBLISHED_KEYS),
+        **metadata,
         "from_dt": None,
         "to_dt": None,
         "updated_dt": None,
@@ -36,12 +46,8 @@ def _initial_bucket(props: Dict[str, Any]) -> AnalysisBucket:
     }
 
 
-def _bucket_key(props: Dict[str, Any]) -> str:
-    parts = [
-        first_present(props, ANALYSIS_ID_KEYS),
-        first_present(props, DATE_FROM_KEYS),
-        first_present(props, DATE_TO_KEYS),
-    ]
+def _bucket_key(metadata: Dict[str, Any]) -> str:
+    parts = (metadata["analysis_id"], metadata["from_raw"], metadata["to_raw"])
     filtered = [str(part) for part in parts if part not in (None, "")]
     return "|".join(filtered) if filtered else "default"
 
@@ -53,6 +59,19 @@ def _hydrate_dates(bucket: AnalysisBucket) -> None:
     bucket["published_dt"] = parse_iso_datetime(bucket.get("published_raw"))
 
 
+def _rank(bucket: AnalysisBucket) -> Tuple:
+    """Ordering key for buckets: coverage first, then the most recent dates."""
+
+    return (
+        1 if bucket.get("covers_current_period") else 0,
+        bucket.get("to_dt") or _MIN_DT,
+        bucket.get("from_dt") or _MIN_DT,
+        bucket.get("updated_dt") or _MIN_DT,
+        bucket.get("published_dt") or _MIN_DT,
+        len(bucket.get("features") or []),
+    )
+
+
 def _covers_current_period(bucket: AnalysisBucket, current_day: Optional[date]) -> bool:
     """Determine whether the analysis period covers the provided day."""
 
@@ -92,47 +111,29 @@ def select_latest_analysis(
         if not isinstance(feature, dict):
             continue
         props = feature.get("properties") or {}
-        key = _bucket_key(props)
-        bucket = analyses.setdefault(key, _initial_bucket(props))
-        bucket["features"].append(feature)
-
-        # Backfill missing metadata when later features include richer fields.
-        for field, keys in (
-            ("analysis_id", ANALYSIS_ID_KEYS),
-            ("analysis_label", ANALYSIS_LABEL_KEYS),
-            ("from_raw", DATE_FROM_KEYS),
-            ("to_raw", DATE_TO_KEYS),
-            ("updated_raw", DATE_UPDATED_KEYS),
-            ("published_raw", DATE_PUBLISHED_KEYS),
-        ):
-            if bucket.get(field) in (None, ""):
-                candidate = first_present(props, keys)
-                if candidate not in (None, ""):
+        metadata = _extract_metadata(props)
+        key = _bucket_key(metadata)
+        bucket = analyses.get(key)
+        if bucket is None:
+            bucket = analyses[key] = _initial_bucket(metadata)
+        else:
+            # Backfill missing metadata when later features include richer fields.
+            # ``first_present`` only ever yields ``None`` or a non-empty value.
+            for field, candidate in metadata.items():
+                if candidate is not None and bucket[field] is None:
                     bucket[field] = candidate
+        bucket["features"].append(feature)
 
     if not analyses:
         return [], {}
 
-    today: Optional[date] = current_date or datetime.utcnow().date()
+    today: Optional[date] = current_date or datetime.now(timezone.utc).date()
     is_current_year = bool(target_year is not None and today and target_year == today.year)
 
     for bucket in analyses.values():
         _hydrate_dates(bucket)
         bucket["covers_current_period"] = _covers_current_period(bucket, today)
-
-    def coverage_score(meta: AnalysisBucket) -> int:
-        return 1 if meta.get("covers_current_period") else 0
-
-    def sort_key(item: Tuple[str, AnalysisBucket]) -> Tuple:
-        _, meta = item
-        return (
-            coverage_score(meta),
-            meta.get("to_dt") or datetime.min,
-            meta.get("from_dt") or datetime.min,
-            meta.get("updated_dt") or datetime.min,
-            meta.get("published_dt") or datetime.min,
-            len(meta.get("features") or []),
-        )
+        bucket["_sort_key"] = _rank(bucket)
 
     items = list(analyses.items())
 
@@ -141,7 +142,7 @@ def select_latest_analysis(
         if covering:
             items = covering
 
-    selected_key, selected_meta = max(items, key=sort_key)
+    selected_key, selected_meta = max(items, key=lambda item: item[1]["_sort_key"])
 
     return selected_meta.get("features", []), {
         "analysis_id": selected_meta.get("analysis_id"),
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -17,6 +17,6 @@ GLOBAL_EXTRA_OUTPUT_PATH = DATA_DIR / GLOBAL_EXTRA_FILENAME
 GLOBAL_INFO = {"name": "Global", "iso2": "GL", "iso3": "GLB"}
 
 API_BASE_URL = "https://api.ipcinfo.org/areas"
-CURRENT_YEAR = datetime.utcnow().year
+CURRENT_YEAR = datetime.now(timezone.utc).year
 AVAILABLE_YEARS = [CURRENT_YEAR]
 DEFAULT_YEARS = [CURRENT_YEAR]
@@ -4,52 +4,55 @@ from __future__ import annotations
 
 import csv
 import sys
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from .config import COUNTRIES_CSV
 
 CountryRow = Dict[str, str]
 
 
-def _normalise_fieldnames(reader: csv.DictReader) -> None:
-    if reader.fieldnames:
-        reader.fieldnames = [field.strip() for field in reader.fieldnames]
+def _cell(row: List[str], index: Optional[int]) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
 
 
-def load_countries(*, ocha_region: Optional[str]) -> Dict[str, CountryRow]:
-    region_filter = (ocha_region or "").strip().lower()
-    if region_filter in {"*", "all"}:
-        region_filter = ""
+class _CountryRecord(NamedTuple):
+    name: str
+    iso2: str
+    iso3: str
+    ocha_region: str
 
-    countries: Dict[str, CountryRow] = {}
+
+@lru_cache(maxsize=1)
+def _load_country_records() -> Tuple[_CountryRecord, ...]:
+    """Parse ``countries.csv`` once per process; rows are filtered per call."""
+
+    records: List[_CountryRecord] = []
 
     try:
         with COUNTRIES_CSV.open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle)
-            _normalise_fieldnames(reader)
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            columns = {name.strip(): index for index, name in enumerate(header)}
+            alpha_2_index = columns.get("Alpha_2_Code")
+            alpha_3_index = columns.get("Alpha_3_Code")
+            name_index = columns.get("English_Short_Name")
+            ocha_index = columns.get("OCHA_Region")
 
             for row in reader:
                 if not row:
                     continue
 
-                alpha_2 = (row.get("Alpha_2_Code") or "").strip()
-                alpha_3 = (row.get("Alpha_3_Code") or "").strip()
-                name = (row.get("English_Short_Name") or "").strip()
-                ocha = (row.get("OCHA_Region") or "").strip()
-
-                if region_filter and ocha.lower() != region_filter:
-                    continue
-
-                if not alpha_2 or not alpha_3:
-                    print("    Skipping row with missing ISO codes")
-                    continue
-
-                countries[alpha_2] = {
-                    "name": name or alpha_2,
-                    "iso2": alpha_2,
-                    "iso3": alpha_3,
-                    "ocha_region": ocha or None,
-                }
+                records.append(
+                    _CountryRecord(
+                        name=_cell(row, name_index),
+                        iso2=_cell(row, alpha_2_index),
+                        iso3=_cell(row, alpha_3_index),
+                        ocha_region=_cell(row, ocha_index),
+                    )
+                )
     except FileNotFoundError:
         print("Error: countries.csv file not found")
         sys.exit(1)
@@ -57,4 +60,29 @@ def load_countries(*, ocha_region: Optional[str]) -> Dict[str, CountryRow]:
         print(f"Error reading countries.csv: {exc}")
         sys.exit(1)
 
+    return tuple(records)
+
+
+def load_countries(*, ocha_region: Optional[str]) -> Dict[str, CountryRow]:
+    region_filter = (ocha_region or "").strip().lower()
+    if region_filter in {"*", "all"}:
+        region_filter = ""
+
+    countries: Dict[str, CountryRow] = {}
+
+    for record in _load_country_records():
+        if region_filter and record.ocha_region.lower() != region_filter:
+            continue
+
+        if not record.iso2 or not record.iso3:
+            print("    Skipping row with missing ISO codes")
+            continue
+
+        countries[record.iso2] = {
+            "name": record.name or record.iso2,
+            "iso2": record.iso2,
+            "iso3": record.iso3,
+            "ocha_region": record.ocha_region or None,
+        }
+
     return countries
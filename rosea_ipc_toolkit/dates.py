@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
-from typing import Any, Iterable, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Tuple
 
 DATE_FROM_KEYS = (
     "from_date",
@@ -47,6 +49,15 @@ ANALYSIS_LABEL_KEYS = (
 )
 
 
+# Numeric layouts accepted by the strptime fallbacks below, matched directly so
+# the common cases skip strptime. Each entry maps groups to (year, month, day).
+_NUMERIC_DATE_PATTERNS = (
+    (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?"), (0, 1, 2)),
+    (re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})"), (2, 1, 0)),
+    (re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})"), (0, 1, 2)),
+)
+
+
 def first_present(props: dict[str, Any], keys: Iterable[str]) -> Optional[Any]:
     """Return the first non-empty value for the given keys."""
 
@@ -57,6 +68,17 @@ def first_present(props: dict[str, Any], keys: Iterable[str]) -> Optional[Any]:
     return None
 
 
+def keys_in_use(keys: Iterable[str], records: Iterable[dict[str, Any]]) -> Tuple[str, ...]:
+    """Return ``keys``, in priority order, that occur in at least one record.
+
+    ``first_present`` over the result gives the same answer for every record
+    while skipping keys the batch never uses.
+    """
+
+    present: set[str] = set().union(*records)
+    return tuple(key for key in keys if key in present)
+
+
 def parse_iso_datetime(value: Any) -> Optional[datetime]:
     """Parse mixed IPC timestamps into naive UTC datetimes when possible."""
 
@@ -73,6 +95,13 @@ def parse_iso_datetime(value: Any) -> Optional[datetime]:
     if not text:
         return None
 
+    return _parse_iso_datetime_str(text)
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_datetime_str(text: str) -> Optional[datetime]:
+    # Features from the same analysis repeat identical strings, so results are
+    # memoised; datetimes are immutable and safe to share.
     normalised = text[:-1] + "+00:00" if text.endswith("Z") else text
 
     try:
@@ -83,6 +112,17 @@ def parse_iso_datetime(value: Any) -> Optional[datetime]:
     except ValueError:
         pass
 
+    for pattern, (year, month, day) in _NUMERIC_DATE_PATTERNS:
+        match = pattern.fullmatch(text)
+        if match is None:
+            continue
+        groups = match.groups()
+        clock = [int(part) for part in groups[3:6] if part is not None]
+        try:
+            return datetime(int(groups[year]), int(groups[month]), int(groups[day]), *clock)
+        except ValueError:
+            break
+
     for fmt in ("%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%d-%m-%Y", "%Y/%m/%d"):
         try:
             return datetime.strptime(text, fmt)
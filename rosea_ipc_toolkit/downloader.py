@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import io
 import json
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency for concurrent downloads
+    aiohttp = None  # type: ignore[assignment]
+
+from ._fast import round_arcs
 from .analysis import select_latest_analysis
 from .auth import resolve_ipc_key
 from .config import (
@@ -33,16 +46,29 @@ from .dates import (
     DATE_TO_KEYS,
     DATE_UPDATED_KEYS,
     first_present,
+    keys_in_use,
+)
+from .feature_utils import (
+    extract_polygonal_geometry,
+    feature_key,
+    geometry_digest,
+    has_polygonal_geometry,
+    sanitise_geometry,
 )
-from .feature_utils import feature_key, sanitise_geometry, extract_polygonal_geometry
 from .git_utils import resolve_release_tag
-from .index import IndexBuilder
+from .index import IndexBuilder, IndexRow
 from .merge import extract_years, flatten_features, merge_features
 from .topology import (
     convert_geojson_to_topology,
     load_topojson_features,
+    merge_topologies,
+    parse_json,
+    read_json,
     save_topology,
     display_relative,
+    topology_geometries,
+    topology_to_features,
+    write_json,
 )
 
 
@@ -54,11 +80,53 @@ class DownloadConfig:
     ocha_region: Optional[str] = "ROSEA"
     request_timeout: int = 30
     retry_delay: float = 0.5
-    rate_limit_delay: float = 1.0
+    rate_limit_delay: float = 0.5
     country_codes: Optional[List[str]] = None
     build_index: bool = True
     extra_global_simplification: bool = False
     extra_global_only: bool = False
+    concurrency: int = 8
+    requests_per_second: float = 4.0
+    max_retries: int = 3
+    workers: Optional[int] = None
+    # Opt-in: the IPC API is not documented to accept comma-separated years.
+    batch_years: bool = False
+
+
+# Statuses worth retrying with backoff during concurrent downloads.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+AreaDownloads = Dict[Tuple[str, int], Optional[Dict[str, Any]]]
+CountryResult = Dict[str, Any]
+
+
+class _RateLimiter:
+    """Space request start times at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+@dataclass(frozen=True)
+class _CountryJobState:
+    """Picklable subset of ``IPCAreaDownloader`` state needed to build a country."""
+
+    config: DownloadConfig
+    years_to_try: List[int]
+    iso2_to_iso3: Dict[str, str]
+    current_date: date
 
 
 class IPCAreaDownloader:
@@ -87,9 +155,33 @@ class IPCAreaDownloader:
         self.extra_global_simplification = config.extra_global_simplification or self.extra_global_only
         self.country_combined_files: List[Path] = []
         self.country_combined_feature_map: Dict[str, List[Dict[str, Any]]] = {}
+        self.country_combined_topologies: Dict[str, Dict[str, Any]] = {}
         self.iso2_to_iso3: Dict[str, str] = {}
         self.country_filter = self._normalise_country_codes(config.country_codes)
-        self.current_date = datetime.utcnow().date()
+        self.current_date = datetime.now(timezone.utc).date()
+        # Worker processes for simplify_topojson; pinned to 1 inside country workers.
+        self.simplify_jobs: Optional[int] = None
+        # Whether the API answers multi-year requests; ``None`` until probed.
+        self.year_batching: Optional[bool] = None if config.batch_years else False
+        # Earliest monotonic time the next sequential request may start.
+        self._next_request_at = 0.0
+
+    @classmethod
+    def _from_job_state(cls, state: _CountryJobState) -> IPCAreaDownloader:
+        """Rebuild a worker-side downloader that processes prefetched downloads only.
+
+        ``__init__`` is bypassed: workers need no HTTP session, API key check,
+        git lookup or index builder.
+        """
+
+        downloader = cls.__new__(cls)
+        downloader.config = state.config
+        downloader.years_to_try = state.years_to_try
+        downloader.iso2_to_iso3 = state.iso2_to_iso3
+        downloader.current_date = state.current_date
+        # Countries already run in parallel; avoid nested simplification pools.
+        downloader.simplify_jobs = 1
+        return downloader
 
     @staticmethod
     def _normalise_years(years: Optional[Iterable[int]]) -> List[int]:
@@ -130,20 +222,18 @@ class IPCAreaDownloader:
         if not self.country_filter:
             return countries
 
-        selected: Dict[str, Dict[str, str]] = {}
-        matched: set[str] = set()
-
+        # Filter codes are already upper-cased; index countries by both codes.
+        by_code: Dict[str, str] = {}
         for iso2, info in countries.items():
-            iso2_code = iso2.upper()
+            by_code.setdefault(iso2.upper(), iso2)
             iso3_code = (info.get("iso3") or "").upper()
+            if iso3_code:
+                by_code.setdefault(iso3_code, iso2)
 
-            if iso2_code in self.country_filter or iso3_code in self.country_filter:
-                selected[iso2] = info
-                matched.add(iso2_code)
-                if iso3_code:
-                    matched.add(iso3_code)
+        wanted = {by_code[code] for code in self.country_filter if code in by_code}
+        selected = {iso2: info for iso2, info in countries.items() if iso2 in wanted}
 
-        missing = [code for code in self.country_filter if code not in matched]
+        missing = [code for code in self.country_filter if code not in by_code]
         if missing:
             print("Warning: requested country codes not found in countries.csv: " + ", ".join(missing))
 
@@ -154,7 +244,22 @@ class IPCAreaDownloader:
 
     def _build_session(self) -> requests.Session:
         session = requests.Session()
-        session.headers.update({"User-Agent": "IPC-Areas-Downloader/1.0"})
+        session.headers.update({"User-Agent": "IPC-Areas-Downloader/1.0", "Connection": "keep-alive"})
+        # One pooled adapter keeps the connection to the API host alive across
+        # every country/year request and retries transient failures.
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=self.config.max_retries,
+                backoff_factor=self.config.retry_delay,
+                status_forcelist=sorted(RETRY_STATUSES),
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
 
     def _normalise_iso3(self, props: Dict[str, Any], country_info: Dict[str, str]) -> str:
@@ -211,17 +316,23 @@ class IPCAreaDownloader:
         successful = 0
         failed = 0
 
-        for iso2, country_info in countries.items():
-            try:
-                if self.process_country(iso2, country_info):
-                    successful += 1
-                else:
-                    failed += 1
-            except Exception as exc:  # noqa: BLE001
-                print(f"Error processing {country_info['name']}: {exc}")
-                failed += 1
+        downloads = self._prefetch_areas(countries)
+        workers = self.config.workers if self.config.workers is not None else (os.cpu_count() or 1)
 
-            time.sleep(self.config.rate_limit_delay)
+        if downloads is not None and workers > 1 and len(countries) > 1:
+            successful, failed = self._process_countries_parallel(
+                countries, downloads, min(workers, len(countries))
+            )
+        else:
+            for iso2, country_info in countries.items():
+                try:
+                    if self.process_country(iso2, country_info, downloads=downloads):
+                        successful += 1
+                    else:
+                        failed += 1
+                except Exception as exc:  # noqa: BLE001
+                    print(f"Error processing {country_info['name']}: {exc}")
+                    failed += 1
 
         self.build_global_dataset()
         if self.index_builder:
@@ -234,8 +345,99 @@ class IPCAreaDownloader:
         print(f"Data saved in: {DATA_DIR.resolve()}")
 
     # Country processing -------------------------------------------------
-    def process_country(self, country_code: str, country_info: Dict[str, str]) -> bool:
+    def process_country(
+        self,
+        country_code: str,
+        country_info: Dict[str, str],
+        *,
+        downloads: Optional[AreaDownloads] = None,
+    ) -> bool:
+        """Merge existing and newly downloaded datasets for one country.
+
+        ``downloads`` holds responses prefetched by ``_prefetch_areas``; when
+        it is ``None`` each year is downloaded here, paced by ``rate_limit_delay``.
+        """
+
+        result = self._build_country_dataset(country_code, country_info, downloads=downloads)
+        return self._record_country(country_info, result)
+
+    def _process_countries_parallel(
+        self,
+        countries: Dict[str, Dict[str, str]],
+        downloads: AreaDownloads,
+        workers: int,
+    ) -> Tuple[int, int]:
+        """Build country datasets in worker processes, recording them in order.
+
+        Workers only touch their own country's files; the index builder and
+        the in-memory global aggregate are updated here in the main process.
+        """
+
+        print(f"Processing {len(countries)} countries across {workers} worker process(es)…")
+        successful = 0
+        failed = 0
+
+        # Ship only the state a worker needs: pickling ``self`` would copy every
+        # country recorded so far into each job, racing ``_record_country``.
+        job_state = _CountryJobState(
+            config=self.config,
+            years_to_try=list(self.years_to_try),
+            iso2_to_iso3=dict(self.iso2_to_iso3),
+            current_date=self.current_date,
+        )
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                (
+                    country_info,
+                    executor.submit(
+                        _build_country_dataset_job,
+                        job_state,
+                        iso2,
+                        country_info,
+                        {
+                            (code, year): payload
+                            for (code, year), payload in downloads.items()
+                            if code == iso2
+                        },
+                    ),
+                )
+                for iso2, country_info in countries.items()
+            ]
+
+            for country_info, future in futures:
+                try:
+                    log, result, error = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    print(f"Error processing {country_info['name']}: {exc}")
+                    failed += 1
+                    continue
+
+                print(log, end="")
+                if error is not None:
+                    print(f"Error processing {country_info['name']}: {error}")
+                    failed += 1
+                    continue
+                if self._record_country(country_info, result):
+                    successful += 1
+                else:
+                    failed += 1
+
+        return successful, failed
+
+    def _build_country_dataset(
+        self,
+        country_code: str,
+        country_info: Dict[str, str],
+        *,
+        downloads: Optional[AreaDownloads] = None,
+    ) -> Optional[CountryResult]:
+        """Write one country's combined dataset; safe to run in a worker process."""
+
         print(f"\nProcessing {country_info['name']} ({country_code})…")
+        if downloads is None:
+            downloads = self._download_year_batch(country_code)
+        prefetched = downloads is not None
 
         iso3 = country_info["iso3"]
         country_dir = DATA_DIR / iso3
@@ -264,7 +466,7 @@ class IPCAreaDownloader:
                         f"{stats['added']} baseline and {stats['updated']} refreshed feature(s)"
                     )
 
-        for path in sorted(country_dir.glob(f"{iso3}_*{COUNTRY_FILENAME_SUFFIX}")):
+        for path in self._scan_year_files(country_dir, iso3):
             year = self._extract_year_from_path(path, iso3)
             if year is None:
                 continue
@@ -292,15 +494,16 @@ class IPCAreaDownloader:
             }
 
         for year in self.years_to_try:
-            areas_data = self._download_areas(country_code, year)
+            if prefetched:
+                areas_data = downloads.get((country_code, year))
+            else:
+                areas_data = self._download_areas(country_code, year)
             if not areas_data:
-                time.sleep(self.config.retry_delay)
                 continue
 
             geojson, analysis_meta = self._filter_and_process(areas_data, country_info, year)
             if not geojson:
                 print(f"    No valid polygon features found for year {year}")
-                time.sleep(self.config.retry_delay)
                 continue
 
             # Enrich features with analysis metadata for better merge prioritization
@@ -342,48 +545,59 @@ class IPCAreaDownloader:
                 f"({stats['added']} new, {stats['updated']} updated){detail}"
             )
 
-            time.sleep(self.config.retry_delay)
-
         if not aggregate:
             print(f"    No data found for {country_info['name']} in any year")
-            return False
+            return None
 
         final_features = flatten_features(aggregate)
         combined_topology = convert_geojson_to_topology(
             {"type": "FeatureCollection", "features": final_features}
         )
+        # Round in memory so the file is already compact should simplification fail.
+        unrounded_arcs = combined_topology["arcs"]
+        combined_topology["arcs"] = self._round_arcs(unrounded_arcs, precision=self.config.precision)
         combined_path = save_topology(combined_topology, modern_combined)
         self._simplify_output(combined_path)
+
+        return {
+            "iso3": iso3,
+            "combined_path": combined_path,
+            "features": final_features,
+            # Full-precision topology of ``features``, reused for the global merge.
+            "topology": {**combined_topology, "arcs": unrounded_arcs},
+            "year_feature_counts": year_feature_counts,
+            "available_years": sorted(year_feature_counts.keys()) or extract_years(aggregate),
+        }
+
+    def _record_country(self, country_info: Dict[str, str], result: Optional[CountryResult]) -> bool:
+        if result is None:
+            return False
+
+        combined_path = result["combined_path"]
+        final_features = result["features"]
+        year_feature_counts = result["year_feature_counts"]
+        available_years = result["available_years"]
         self.country_combined_files.append(combined_path)
-        self.country_combined_feature_map[iso3] = final_features
+        self.country_combined_feature_map[result["iso3"]] = final_features
+        self.country_combined_topologies[result["iso3"]] = result["topology"]
 
         feature_count = len(final_features)
-        available_years = sorted(year_feature_counts.keys()) or extract_years(aggregate)
 
         if self.index_builder:
+            rows: List[IndexRow] = []
             for year in available_years:
                 stats = year_feature_counts.get(year)
                 if not stats:
                     continue
                 analysis_info = stats.get("analysis") or {}
                 updated_hint = analysis_info.get("updated_at") or analysis_info.get("to_date")
-                self.index_builder.add_entry(
-                    country_info,
-                    year=year,
-                    path=stats["path"],
-                    feature_count=stats.get("feature_count"),
-                    variant="year",
-                    updated_at=updated_hint,
+                rows.append(
+                    IndexRow(country_info, year, stats["path"], stats.get("feature_count"), "year", updated_hint)
                 )
 
             representative_year = available_years[-1] if available_years else None
-            self.index_builder.add_entry(
-                country_info,
-                year=representative_year,
-                path=combined_path,
-                feature_count=feature_count,
-                variant="combined",
-            )
+            rows.append(IndexRow(country_info, representative_year, combined_path, feature_count, "combined"))
+            self.index_builder.add_entries(rows)
 
         print(
             f"    Combined dataset saved with {feature_count} features across "
@@ -393,8 +607,8 @@ class IPCAreaDownloader:
         return True
 
     # Download helpers ---------------------------------------------------
-    def _download_areas(self, country_code: str, year: int) -> Optional[Dict[str, Any]]:
-        params = {
+    def _area_params(self, country_code: str, year: int | str) -> Dict[str, Any]:
+        return {
             "format": "geojson",
             "country": country_code,
             "year": year,
@@ -402,6 +616,36 @@ class IPCAreaDownloader:
             "key": self.ipc_key,
         }
 
+    @staticmethod
+    def _validate_areas(data: Any, country_code: str, year: int) -> Optional[Dict[str, Any]]:
+        if (
+            isinstance(data, dict)
+            and isinstance(data.get("features"), list)
+            and data["features"]
+        ):
+            return data
+
+        print(f"    No data available for {country_code} in {year}")
+        return None
+
+    def _throttle_request(self) -> None:
+        """Space sequential request starts ``rate_limit_delay`` seconds apart.
+
+        Only issued requests are paced, so cached years, skipped countries and
+        local processing time all count towards the gap.
+        """
+
+        now = time.monotonic()
+        wait = self._next_request_at - now
+        if wait > 0:
+            time.sleep(wait)
+            now += wait
+        self._next_request_at = now + self.config.rate_limit_delay
+
+    def _download_areas(self, country_code: str, year: int | str) -> Optional[Dict[str, Any]]:
+        params = self._area_params(country_code, year)
+        self._throttle_request()
+
         try:
             print(f"  Downloading data for {country_code} - {year}…")
             response = self.session.get(
@@ -418,19 +662,169 @@ class IPCAreaDownloader:
             return None
 
         try:
-            data = response.json()
+            data = parse_json(response.content)
         except json.JSONDecodeError as exc:
             print(f"    Invalid JSON response for {country_code} - {year}: {exc}")
             return None
 
-        if (
-            isinstance(data, dict)
-            and isinstance(data.get("features"), list)
-            and data["features"]
-        ):
-            return data
+        return self._validate_areas(data, country_code, year)
 
-        print(f"    No data available for {country_code} in {year}")
+    def _year_batch_param(self) -> Optional[str]:
+        if self.year_batching is False or len(self.years_to_try) < 2:
+            return None
+        return ",".join(str(year) for year in self.years_to_try)
+
+    def _split_by_year(
+        self,
+        country_code: str,
+        data: Optional[Dict[str, Any]],
+    ) -> Optional[AreaDownloads]:
+        """Group a multi-year response by each feature's ``year`` property.
+
+        Returns ``None`` when any feature lacks a requested year, i.e. the API
+        did not honour the year list.
+        """
+
+        if data is None:
+            return None
+
+        groups: Dict[int, List[Dict[str, Any]]] = {year: [] for year in self.years_to_try}
+        for feature in data["features"]:
+            props = feature.get("properties") if isinstance(feature, dict) else None
+            try:
+                year = int((props or {}).get("year"))
+            except (TypeError, ValueError):
+                return None
+            if year not in groups:
+                return None
+            groups[year].append(feature)
+
+        return {
+            (country_code, year): {**data, "features": features} if features else None
+            for year, features in groups.items()
+        }
+
+    @staticmethod
+    def _covers_several_years(downloads: Optional[AreaDownloads]) -> bool:
+        # An API that ignores all but one year of the list also yields a
+        # cleanly splittable response, so only a multi-year answer proves support.
+        return downloads is not None and sum(1 for data in downloads.values() if data) > 1
+
+    def _download_year_batch(self, country_code: str) -> Optional[AreaDownloads]:
+        """Fetch all configured years in one request once the API is known to allow it.
+
+        The first attempt doubles as the probe: unless its response holds
+        features for more than one requested year, batching is disabled for
+        the rest of the run and that country is downloaded year by year.
+        """
+
+        batch_param = self._year_batch_param()
+        if batch_param is None:
+            return None
+
+        downloads = self._split_by_year(country_code, self._download_areas(country_code, batch_param))
+        if self.year_batching is None:
+            self.year_batching = self._covers_several_years(downloads)
+            if not self.year_batching:
+                print("    Multi-year requests unconfirmed; downloading years individually")
+                return None
+        return downloads
+
+    def _prefetch_areas(self, countries: Dict[str, Dict[str, str]]) -> Optional[AreaDownloads]:
+        """Download every country/year pair concurrently before processing.
+
+        Returns ``None`` (sequential downloads) when aiohttp is not installed
+        or ``concurrency`` is 1 or less.
+        """
+
+        if aiohttp is None or self.config.concurrency <= 1:
+            return None
+
+        print(
+            f"Downloading {len(countries) * len(self.years_to_try)} country-year dataset(s) "
+            f"with up to {self.config.concurrency} concurrent request(s)…"
+        )
+        return asyncio.run(self._prefetch_async(list(countries)))
+
+    async def _prefetch_async(self, codes: List[str]) -> AreaDownloads:
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        limiter = _RateLimiter(self.config.requests_per_second)
+        connector = aiohttp.TCPConnector(limit_per_host=self.config.concurrency)
+        timeout = aiohttp.ClientTimeout(total=self.config.request_timeout)
+        downloads: AreaDownloads = {}
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=dict(self.session.headers),
+        ) as session:
+
+            def fetch(code: str, year: int | str) -> Any:
+                return self._download_areas_async(session, code, year, semaphore, limiter)
+
+            pending = codes
+            batch_param = self._year_batch_param()
+            if batch_param is not None and codes:
+                # Probe with the first country before fanning out batched requests.
+                probe = self._split_by_year(codes[0], await fetch(codes[0], batch_param))
+                if self.year_batching is None:
+                    self.year_batching = self._covers_several_years(probe)
+                if not self.year_batching:
+                    print("    Multi-year requests unconfirmed; downloading years individually")
+                else:
+                    downloads.update(probe)
+                    batches = await asyncio.gather(*(fetch(code, batch_param) for code in codes[1:]))
+                    pending = []
+                    for code, data in zip(codes[1:], batches):
+                        grouped = self._split_by_year(code, data)
+                        if grouped is None:
+                            pending.append(code)
+                        else:
+                            downloads.update(grouped)
+
+            pairs = [(code, year) for code in pending for year in self.years_to_try]
+            results = await asyncio.gather(*(fetch(code, year) for code, year in pairs))
+            downloads.update(zip(pairs, results))
+
+        return downloads
+
+    async def _download_areas_async(
+        self,
+        session: "aiohttp.ClientSession",
+        country_code: str,
+        year: int | str,
+        semaphore: asyncio.Semaphore,
+        limiter: _RateLimiter,
+    ) -> Optional[Dict[str, Any]]:
+        params = {key: str(value) for key, value in self._area_params(country_code, year).items()}
+        message = ""
+
+        for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.config.retry_delay * 2 ** (attempt - 1))
+
+            async with semaphore:
+                await limiter.acquire()
+                try:
+                    async with session.get(API_BASE_URL, params=params) as response:
+                        if response.status in RETRY_STATUSES:
+                            message = f"HTTP {response.status} for {country_code} - {year}"
+                            continue
+                        if response.status != 200:
+                            print(f"    HTTP {response.status} for {country_code} - {year}")
+                            return None
+                        try:
+                            data = parse_json(await response.read())
+                        except json.JSONDecodeError as exc:
+                            print(f"    Invalid JSON response for {country_code} - {year}: {exc}")
+                            return None
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    message = f"Request failed for {country_code} - {year}: {exc}"
+                    continue
+
+            return self._validate_areas(data, country_code, year)
+
+        print(f"    {message}")
         return None
 
     def _filter_and_process(
@@ -446,12 +840,19 @@ class IPCAreaDownloader:
             current_date=self.current_date,
         )
 
+        # The batch shares a schema, so look only at date keys it actually uses.
+        all_props = [feature.get("properties") or {} for feature in selected_features]
+        from_keys = keys_in_use(DATE_FROM_KEYS, all_props)
+        to_keys = keys_in_use(DATE_TO_KEYS, all_props)
+
         cleaned_features: List[Dict[str, Any]] = []
-        seen_geometries: set[str] = set()
+        seen_geometries: set[bytes] = set()
         seen_ids: set[str] = set()
 
         for feature in selected_features:
             original_geometry = feature.get("geometry")
+            if not has_polygonal_geometry(original_geometry):
+                continue
             geometry = sanitise_geometry(original_geometry)
             if not geometry:
                 continue
@@ -460,8 +861,8 @@ class IPCAreaDownloader:
             if not geometry:
                 continue
 
-            geometry_str = json.dumps(geometry, sort_keys=True)
-            if geometry_str in seen_geometries:
+            digest = geometry_digest(geometry)
+            if digest in seen_geometries:
                 continue
 
             props = feature.get("properties") or {}
@@ -470,7 +871,7 @@ class IPCAreaDownloader:
             if feature_id_str and feature_id_str in seen_ids:
                 continue
 
-            seen_geometries.add(geometry_str)
+            seen_geometries.add(digest)
             if feature_id_str:
                 seen_ids.add(feature_id_str)
 
@@ -484,11 +885,11 @@ class IPCAreaDownloader:
             if feature_id is not None:
                 attributes["id"] = feature_id
 
-            from_value = first_present(props, DATE_FROM_KEYS)
+            from_value = first_present(props, from_keys)
             if from_value is not None:
                 attributes["from"] = from_value
 
-            to_value = first_present(props, DATE_TO_KEYS)
+            to_value = first_present(props, to_keys)
             if to_value is not None:
                 attributes["to"] = to_value
 
@@ -511,41 +912,46 @@ class IPCAreaDownloader:
         print("\nBuilding global dataset…")
 
         aggregate: Dict[str, Dict[str, Any]] = {}
+        # Each source's topology (if known) and features, by merge label, so the
+        # global topology can reuse their arcs instead of being rebuilt.
+        sources: Dict[str, Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]] = {}
 
         processed_iso3: set[str] = set()
         for iso3, features in self.country_combined_feature_map.items():
             processed_iso3.add(iso3)
+            source_label = f"memory:{iso3}"
+            sources[source_label] = (self.country_combined_topologies.get(iso3), features)
             merge_features(
                 aggregate,
                 features,
                 priority=0,
                 source_year=None,
-                source_label=f"memory:{iso3}",
+                source_label=source_label,
             )
 
-        for country_dir in sorted(DATA_DIR.iterdir()):
-            if not country_dir.is_dir():
-                continue
-            iso3 = country_dir.name
-            if iso3 in processed_iso3:
-                continue
-
-            topo_candidate = country_dir / f"{iso3}{COUNTRY_COMBINED_SUFFIX}"
+        with os.scandir(DATA_DIR) as entries:
+            country_names = sorted(
+                entry.name for entry in entries if entry.is_dir() and entry.name not in processed_iso3
+            )
 
-            features: List[Dict[str, Any]] = []
+        for iso3 in country_names:
+            topo_candidate = DATA_DIR / iso3 / f"{iso3}{COUNTRY_COMBINED_SUFFIX}"
 
-            if topo_candidate.exists():
-                try:
-                    features = load_topojson_features(topo_candidate)
-                except Exception as exc:  # noqa: BLE001
-                    print(
-                        f"  Warning: unable to read existing dataset {display_relative(topo_candidate)}: {exc}"
-                    )
-                    continue
+            try:
+                topo_payload = read_json(topo_candidate)
+                features = topology_to_features(topo_payload)
+            except FileNotFoundError:
+                continue
+            except Exception as exc:  # noqa: BLE001
+                print(
+                    f"  Warning: unable to read existing dataset {display_relative(topo_candidate)}: {exc}"
+                )
+                continue
 
             if not features:
                 continue
 
+            sources[topo_candidate.name] = (topo_payload, features)
             merge_features(
                 aggregate,
                 features,
@@ -558,21 +964,18 @@ class IPCAreaDownloader:
             print("  Warning: no features discovered while building the global dataset")
             return
 
-        final_features = flatten_features(aggregate)
-        
         # Remove color and year properties from global dataset features to reduce file size
-        for feature in final_features:
-            if "properties" in feature:
-                feature["properties"].pop("color", None)
-                feature["properties"].pop("year", None)
-        
-        final_topology = convert_geojson_to_topology(
-            {"type": "FeatureCollection", "features": final_features}
-        )
+        final_features = flatten_features(aggregate, strip_props=("color", "year"))
+
+        final_topology = self._merge_source_topologies(aggregate, final_features, sources)
+        if final_topology is None:
+            final_topology = convert_geojson_to_topology(
+                {"type": "FeatureCollection", "features": final_features}
+            )
         
         # Apply aggressive coordinate rounding to reduce global dataset size
         if 'arcs' in final_topology:
-            final_topology['arcs'] = self._round_coordinates(final_topology['arcs'], precision=2)
+            final_topology['arcs'] = self._round_arcs(final_topology['arcs'], precision=2)
         saved_global = save_topology(final_topology, GLOBAL_OUTPUT_PATH)
         
         # Apply aggressive simplification to global dataset
@@ -606,22 +1009,12 @@ class IPCAreaDownloader:
         representative_year = years_seen[-1] if years_seen else None
 
         if self.index_builder:
-            self.index_builder.add_entry(
-                GLOBAL_INFO,
-                year=representative_year,
-                path=saved_global,
-                feature_count=len(final_features),
-                variant="global",
-            )
-
+            rows = [IndexRow(GLOBAL_INFO, representative_year, saved_global, len(final_features), "global")]
             if self.extra_global_simplification and extra_global_path and extra_global_path.exists():
-                self.index_builder.add_entry(
-                    GLOBAL_INFO,
-                    year=representative_year,
-                    path=extra_global_path,
-                    feature_count=len(final_features),
-                    variant="global_min",
+                rows.append(
+                    IndexRow(GLOBAL_INFO, representative_year, extra_global_path, len(final_features), "global_min")
                 )
+            self.index_builder.add_entries(rows)
 
         if self.extra_global_simplification and extra_global_path and extra_global_path.exists():
             print(
@@ -673,7 +1066,59 @@ class IPCAreaDownloader:
             f"{display_relative(GLOBAL_EXTRA_OUTPUT_PATH)}"
         )
 
+    @staticmethod
+    def _merge_source_topologies(
+        aggregate: Dict[str, Dict[str, Any]],
+        final_features: List[Dict[str, Any]],
+        sources: Dict[str, Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]],
+    ) -> Optional[Dict[str, Any]]:
+        """Assemble the global topology from the winning features' source arcs.
+
+        Returns ``None`` when a source has no topology whose geometries line up
+        one-to-one (and key-unique) with its features, or when the arcs cannot
+        be merged; the caller then rebuilds the topology from features.
+        """
+
+        topologies: List[Dict[str, Any]] = []
+        geometry_maps: Dict[str, Tuple[int, Dict[str, Dict[str, Any]]]] = {}
+        for source_label, (topology, features) in sources.items():
+            if topology is None:
+                return None
+            geometries = topology_geometries(topology)
+            if len(geometries) != len(features):
+                return None
+            by_key = {feature_key(feature): geometry for feature, geometry in zip(features, geometries)}
+            if len(by_key) != len(features):
+                return None
+            geometry_maps[source_label] = (len(topologies), by_key)
+            topologies.append(topology)
+
+        # ``flatten_features`` orders features by aggregate key.
+        selected: List[Tuple[int, Dict[str, Any]]] = []
+        for key, feature in zip(sorted(aggregate), final_features):
+            source_index, by_key = geometry_maps[aggregate[key]["source_label"]]
+            selected.append((source_index, {**by_key[key], "properties": feature.get("properties") or {}}))
+
+        try:
+            return merge_topologies(topologies, selected)
+        except ValueError as exc:
+            print(f"  Rebuilding global topology from features: {exc}")
+            return None
+
     # Utility functions --------------------------------------------------
+    @staticmethod
+    def _scan_year_files(country_dir: Path, iso3: str) -> List[Path]:
+        prefix = f"{iso3}_"
+        with os.scandir(country_dir) as entries:
+            names = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(COUNTRY_FILENAME_SUFFIX)
+                and entry.is_file()
+            )
+        return [country_dir / name for name in names]
+
     def _extract_year_from_path(self, filepath: Path, iso3: str) -> Optional[int]:
         name = filepath.name
         if not name.startswith(f"{iso3}_") or not name.endswith(COUNTRY_FILENAME_SUFFIX):
@@ -701,16 +1146,20 @@ class IPCAreaDownloader:
             except OSError as exc:  # noqa: BLE001
                 print(f"    Warning: unable to remove legacy dataset {legacy_path}: {exc}")
 
-    def _round_coordinates(self, obj, precision=3):
-        """Recursively round all coordinate values to specified precision."""
-        if isinstance(obj, list):
-            return [self._round_coordinates(item, precision) for item in obj]
-        elif isinstance(obj, (int, float)):
-            return round(obj, precision)
-        elif isinstance(obj, dict):
-            return {key: self._round_coordinates(value, precision) for key, value in obj.items()}
-        else:
-            return obj
+    @staticmethod
+    def _round_arcs(arcs: List[Any], precision: int = 3) -> List[Any]:
+        """Round absolute (unquantized) TopoJSON arcs to ``precision`` decimals.
+
+        Arcs come back as ``float64`` NumPy arrays for ``write_json`` to encode
+        directly.
+        """
+
+        rounded = round_arcs(arcs, precision, as_arrays=True)
+        if rounded is not None:
+            return rounded
+
+        # Ragged positions (mixed dimensions) are rounded point by point.
+        return [[[round(value, precision) for value in point] for point in arc] for arc in arcs]
 
     def _simplify_output(self, topo_path: Path) -> None:
         try:
@@ -723,38 +1172,14 @@ class IPCAreaDownloader:
                 precision=self.config.precision,
                 simplify_tolerance=self.config.simplify_tolerance,
                 quiet=True,
+                jobs=self.simplify_jobs,
             )
-            
-            # Apply additional coordinate rounding for combined files to reduce size
-            self._apply_coordinate_rounding(topo_path, precision=self.config.precision)
-            
         except Exception as exc:  # noqa: BLE001
             print(f"    Warning: unable to simplify {topo_path.name}: {exc}")
-    
-    def _apply_coordinate_rounding(self, topo_path: Path, precision: int = 2) -> None:
-        """Apply coordinate rounding to a TopoJSON file to reduce file size."""
-        try:
-            import json
-            
-            # Read the file
-            with open(topo_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Round coordinates in arcs
-            if 'arcs' in data:
-                data['arcs'] = self._round_coordinates(data['arcs'], precision)
-            
-            # Write back with compact JSON
-            with open(topo_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, separators=(',', ':'))
-                
-        except Exception as exc:  # noqa: BLE001
-            print(f"    Warning: unable to round coordinates in {topo_path.name}: {exc}")
 
     def _strip_global_properties(self, topo_path: Path, keys: Tuple[str, ...]) -> None:
         try:
-            with topo_path.open("r", encoding="utf-8") as handle:
-                payload = json.load(handle)
+            payload = read_json(topo_path)
 
             objects = payload.get("objects") if isinstance(payload, dict) else None
             if not isinstance(objects, dict):
@@ -775,8 +1200,7 @@ class IPCAreaDownloader:
                             changed = True
 
             if changed:
-                with topo_path.open("w", encoding="utf-8") as handle:
-                    json.dump(payload, handle, separators=(",", ":"))
+                write_json(topo_path, payload)
         except Exception as exc:  # noqa: BLE001
             print(f"    Warning: unable to strip properties from {topo_path.name}: {exc}")
 
@@ -788,3 +1212,24 @@ class IPCAreaDownloader:
             if value:
                 parts.append(str(value))
         return f" [{', '.join(parts)}]" if parts else ""
+
+
+def _build_country_dataset_job(
+    state: _CountryJobState,
+    country_code: str,
+    country_info: Dict[str, str],
+    downloads: AreaDownloads,
+) -> Tuple[str, Optional[CountryResult], Optional[str]]:
+    """Process-pool entry point: build one country and return its captured log.
+
+    Failures are returned as an error message alongside the log printed so far.
+    """
+
+    downloader = IPCAreaDownloader._from_job_state(state)
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            result = downloader._build_country_dataset(country_code, country_info, downloads=downloads)
+    except Exception as exc:  # noqa: BLE001
+        return log.getvalue(), None, str(exc)
+    return log.getvalue(), result, None
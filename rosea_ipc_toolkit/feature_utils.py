@@ -5,12 +5,17 @@ from __future__ import annotations
 import copy
 import hashlib
 import json
-from typing import Any, Dict, List, Optional
+from array import array
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional
 
 Feature = Dict[str, Any]
 
 Geometry = Dict[str, Any]
 
+# Property used to memoise hash-derived feature keys between merge passes.
+CACHED_KEY_PROPERTY = "_cached_key"
+
 
 def normalize_title(title: str | None) -> str:
     if not title:
@@ -30,19 +35,106 @@ def feature_key(feature: Feature) -> str:
     if title_key:
         return f"title::{iso_value}::{title_key}" if iso_value else f"title::{title_key}"
 
+    # Hash-derived keys are expensive, so they are cached on the properties;
+    # id and title keys above stay authoritative if those fields appear later.
+    cached = props.get(CACHED_KEY_PROPERTY)
+    if isinstance(cached, str):
+        return cached
+
     geometry = feature.get("geometry")
-    if geometry:
-        geometry_str = json.dumps(geometry, sort_keys=True)
-        digest = hashlib.sha1(geometry_str.encode("utf-8")).hexdigest()
-        return f"geometry::{digest}"
+    if isinstance(geometry, dict) and geometry:
+        key = f"geometry::{geometry_digest(geometry, digest_size=12).hex()}"
+    else:
+        fallback_str = json.dumps(feature, sort_keys=True)
+        digest = hashlib.blake2b(fallback_str.encode("utf-8"), digest_size=12).hexdigest()
+        key = f"feature::{digest}"
+
+    if isinstance(feature.get("properties"), dict):
+        feature["properties"][CACHED_KEY_PROPERTY] = key
+    return key
+
+
+def strip_cached_keys(features: List[Feature]) -> List[Feature]:
+    """Remove memoised ``feature_key`` values before features are written out."""
+
+    for feature in features:
+        props = feature.get("properties")
+        if isinstance(props, dict):
+            props.pop(CACHED_KEY_PROPERTY, None)
+    return features
+
+
+def geometry_digest(geometry: Geometry, *, digest_size: int = 16) -> bytes:
+    """Return a BLAKE2b digest of a geometry's type and coordinates.
+
+    Positions are fed to the hash as packed doubles one line or ring at a time,
+    so no JSON string of the whole geometry is ever built.
+    """
 
-    fallback_str = json.dumps(feature, sort_keys=True)
-    digest = hashlib.sha1(fallback_str.encode("utf-8")).hexdigest()
-    return f"feature::{digest}"
+    digest = hashlib.blake2b(digest_size=digest_size)
+    _hash_geometry(geometry, digest.update)
+    return digest.digest()
 
 
-def sanitise_geometry(geometry: Any) -> Optional[Geometry]:
-    """Return a deep-copied GeoJSON geometry or ``None`` if invalid."""
+def _hash_geometry(geometry: Any, update: Callable[[bytes], None]) -> None:
+    if not isinstance(geometry, dict):
+        update(repr(geometry).encode("utf-8"))
+        return
+
+    geom_type = geometry.get("type")
+    update(f"{geom_type}(".encode("utf-8"))
+    if geom_type == "GeometryCollection":
+        for member in geometry.get("geometries") or []:
+            _hash_geometry(member, update)
+    else:
+        _hash_coords(geometry.get("coordinates"), update)
+    update(b")")
+
+
+def _hash_coords(coords: Any, update: Callable[[bytes], None]) -> None:
+    if not isinstance(coords, list):
+        update(repr(coords).encode("utf-8"))
+        return
+
+    if coords and isinstance(coords[0], (int, float)):
+        try:
+            packed = array("d", coords)
+        except TypeError:
+            pass
+        else:
+            update(b"P%d:" % len(packed))
+            update(packed.tobytes())
+            return
+    elif (
+        coords
+        and isinstance(coords[0], list)
+        and coords[0]
+        and isinstance(coords[0][0], (int, float))
+        # The frame below only pins the width when every position shares it.
+        and len(set(map(len, coords))) == 1
+    ):
+        try:
+            packed = array("d", chain.from_iterable(coords))
+        except TypeError:
+            pass
+        else:
+            update(b"L%d:%d:" % (len(coords), len(packed)))
+            update(packed.tobytes())
+            return
+
+    update(b"[%d" % len(coords))
+    for member in coords:
+        _hash_coords(member, update)
+    update(b"]")
+
+
+def sanitise_geometry(geometry: Any, *, deep: bool = False) -> Optional[Geometry]:
+    """Return a validated GeoJSON geometry or ``None`` if invalid or of unknown type.
+
+    The outer dicts (and ``bbox``) are always new, but coordinate lists are
+    shared with ``geometry`` unless ``deep`` is set; pass ``deep=True`` when
+    the result will be mutated in place.
+    """
 
     if not isinstance(geometry, dict):
         return None
@@ -55,7 +147,7 @@ def sanitise_geometry(geometry: Any) -> Optional[Geometry]:
             return None
         members: List[Geometry] = []
         for child in geometries_field:
-            cleaned = sanitise_geometry(child)
+            cleaned = sanitise_geometry(child, deep=deep)
             if cleaned is not None:
                 members.append(cleaned)
 
@@ -64,32 +156,50 @@ def sanitise_geometry(geometry: Any) -> Optional[Geometry]:
 
         result: Geometry = {"type": "GeometryCollection", "geometries": members}
         if "bbox" in geometry and isinstance(geometry["bbox"], list):
-            result["bbox"] = copy.deepcopy(geometry["bbox"])
+            result["bbox"] = list(geometry["bbox"])
         return result
 
-    if geom_type in {"Point", "MultiPoint", "LineString", "MultiLineString", "Polygon", "MultiPolygon"}:
-        coordinates = geometry.get("coordinates")
-        if coordinates is None:
-            return None
-        result = {"type": geom_type, "coordinates": copy.deepcopy(coordinates)}
-        if "bbox" in geometry and isinstance(geometry["bbox"], list):
-            result["bbox"] = copy.deepcopy(geometry["bbox"])
-        return result
-
-    if geom_type in {"CircularString", "CompoundCurve", "CurvePolygon"}:
+    if geom_type in {
+        "Point",
+        "MultiPoint",
+        "LineString",
+        "MultiLineString",
+        "Polygon",
+        "MultiPolygon",
         # Non-standard GeoJSON types sometimes returned by upstream sources.
+        "CircularString",
+        "CompoundCurve",
+        "CurvePolygon",
+    }:
         coordinates = geometry.get("coordinates")
         if coordinates is None:
             return None
-        result = {"type": geom_type, "coordinates": copy.deepcopy(coordinates)}
+        result = {"type": geom_type, "coordinates": copy.deepcopy(coordinates) if deep else coordinates}
         if "bbox" in geometry and isinstance(geometry["bbox"], list):
-            result["bbox"] = copy.deepcopy(geometry["bbox"])
+            result["bbox"] = list(geometry["bbox"])
         return result
 
-    try:
-        return json.loads(json.dumps(geometry))
-    except (TypeError, ValueError):
-        return None
+    # Unknown geometry types cannot be converted to topology, so reject them.
+    return None
+
+
+def has_polygonal_geometry(geometry: Any) -> bool:
+    """Return whether ``sanitise_geometry`` + ``extract_polygonal_geometry`` keep anything.
+
+    Only types and container shapes are inspected, so features without
+    polygonal content can be dropped before their coordinates are copied.
+    """
+
+    if not isinstance(geometry, dict):
+        return False
+
+    geom_type = geometry.get("type")
+    if geom_type in {"Polygon", "MultiPolygon"}:
+        return geometry.get("coordinates") is not None
+    if geom_type == "GeometryCollection":
+        members = geometry.get("geometries")
+        return isinstance(members, list) and any(has_polygonal_geometry(member) for member in members)
+    return False
 
 
 def extract_polygonal_geometry(geometry: Geometry | None) -> Optional[Geometry]:
@@ -99,6 +209,9 @@ def extract_polygonal_geometry(geometry: Geometry | None) -> Optional[Geometry]:
     cannot triangulate into ``arcs``. We retain Polygon and MultiPolygon
     members, discarding everything else. If no polygonal content remains the
     caller should skip the feature.
+
+    The result shares coordinate lists with ``geometry``; only the outer
+    dicts are new.
     """
 
     if not isinstance(geometry, dict):
@@ -106,7 +219,7 @@ def extract_polygonal_geometry(geometry: Geometry | None) -> Optional[Geometry]:
 
     geom_type = geometry.get("type")
     if geom_type in {"Polygon", "MultiPolygon"}:
-        return copy.deepcopy(geometry)
+        return dict(geometry)
 
     if geom_type == "GeometryCollection":
         members = geometry.get("geometries")
@@ -127,7 +240,7 @@ def extract_polygonal_geometry(geometry: Geometry | None) -> Optional[Geometry]:
 
         result: Geometry = {"type": "GeometryCollection", "geometries": filtered}
         if "bbox" in geometry and isinstance(geometry["bbox"], list):
-            result["bbox"] = copy.deepcopy(geometry["bbox"])
+            result["bbox"] = list(geometry["bbox"])
         return result
 
     # Non-surface geometry types are ignored for topology conversion.
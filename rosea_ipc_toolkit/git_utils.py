@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import subprocess
@@ -18,62 +19,85 @@ def resolve_release_tag() -> str:
     if env_tag:
         return env_tag
 
+    return _git_release_tag()
+
+
+def clear_release_tag_cache() -> None:
+    """Forget memoised git lookups, e.g. after tagging within the same process."""
+
+    _git_release_tag.cache_clear()
+    _list_tags.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _git_release_tag() -> str:
+    # Each lookup forks a git process; the answer cannot change within a run,
+    # so it is resolved once per process. CDN_RELEASE_TAG is still read on
+    # every call above so an override always wins.
     next_semver = _determine_next_semver_tag()
     if next_semver:
         return next_semver
 
-    git_commands = [
-        ["git", "describe", "--tags", "--abbrev=0"],
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-        ["git", "rev-parse", "--short", "HEAD"],
-    ]
-
-    for cmd in git_commands:
-        try:
-            result = subprocess.check_output(cmd, stderr=subprocess.DEVNULL, cwd=REPO_ROOT)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
-
-        tag = result.decode().strip()
+    # ``git describe`` can only succeed when some tag exists, and the tag
+    # list is already known from the semver lookup.
+    if _list_tags():
+        tag = _git_output(["git", "describe", "--tags", "--abbrev=0"])
         if tag and tag != "HEAD":
             return tag
 
+    branch = _git_output(["git", "rev-parse", "--abbrev-ref", "HEAD"])
+    if branch and branch != "HEAD":
+        return branch
+
+    # Detached HEAD: fall back to the abbreviated commit hash.
+    short_hash = _git_output(["git", "rev-parse", "--short", "HEAD"])
+    if short_hash and short_hash != "HEAD":
+        return short_hash
+
     return "main"
 
 
-def _determine_next_semver_tag() -> Optional[str]:
+def _git_output(cmd: List[str]) -> Optional[str]:
     try:
-        tag_output = subprocess.check_output(
-            ["git", "tag", "--list"], stderr=subprocess.DEVNULL, cwd=REPO_ROOT
+        result = subprocess.check_output(
+            cmd, stderr=subprocess.DEVNULL, cwd=REPO_ROOT, text=True, errors="replace"
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
+    return result.strip()
 
-    tags = [line.strip() for line in tag_output.decode().splitlines() if line.strip()]
-    parsed_tags: List[Tuple[Tuple[int, int, int], Tuple[int, ...]]] = []
 
-    for tag in tags:
-        match = SEMVER_PATTERN.match(tag)
-        if not match:
-            continue
+@functools.lru_cache(maxsize=1)
+def _list_tags() -> Optional[Tuple[str, ...]]:
+    output = _git_output(["git", "tag", "--list"])
+    if output is None:
+        return None
+    return tuple(line.strip() for line in output.splitlines() if line.strip())
 
-        groups = match.groups()
-        normalized = (
-            int(groups[0]),
-            int(groups[1]) if groups[1] is not None else 0,
-            int(groups[2]) if groups[2] is not None else 0,
-        )
-        length = 1 + sum(1 for group in groups[1:] if group is not None)
-        parsed_tags.append((normalized, normalized[:length]))
 
-    if not parsed_tags:
+def _determine_next_semver_tag() -> Optional[str]:
+    tags = _list_tags()
+    if tags is None:
         return None
 
-    _, original = max(parsed_tags, key=lambda item: item[0])
+    matches = (SEMVER_PATTERN.match(tag) for tag in tags)
+    best = max((_semver_parts(match.groups()) for match in matches if match), key=lambda item: item[0], default=None)
+    if best is None:
+        return None
 
+    # Bump the last component that was actually written, so v1.2 -> v1.3.
+    _, original = best
     parts_list = list(original)
-    if not parts_list:
-        parts_list = [0]
     parts_list[-1] += 1
 
     return "v" + ".".join(str(part) for part in parts_list)
+
+
+def _semver_parts(groups: Tuple[Optional[str], ...]) -> Tuple[Tuple[int, int, int], Tuple[int, ...]]:
+    normalized = (
+        int(groups[0]),
+        int(groups[1]) if groups[1] is not None else 0,
+        int(groups[2]) if groups[2] is not None else 0,
+    )
+    length = 1 + sum(1 for group in groups[1:] if group is not None)
+    return normalized, normalized[:length]
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 
 from .config import REPO_ROOT
-from .topology import display_relative, infer_feature_count
+from .topology import display_relative, infer_feature_count, write_json
 
 IndexEntry = Dict[str, Any]
 
 
+class IndexRow(NamedTuple):
+    """Positional arguments of one ``IndexBuilder`` entry."""
+
+    country_info: Dict[str, str]
+    year: Optional[int]
+    path: Path
+    feature_count: Optional[int]
+    variant: str
+    updated_at: Optional[str] = None
+
+
 class IndexBuilder:
     def __init__(self, *, release_tag: str, output_dir: Path) -> None:
         self.release_tag = release_tag
@@ -29,14 +39,21 @@ class IndexBuilder:
         variant: str,
         updated_at: Optional[str] = None,
     ) -> None:
+        self.add_entries([IndexRow(country_info, year, path, feature_count, variant, updated_at)])
+
+    def add_entries(self, rows: Iterable[IndexRow]) -> None:
+        """Append one index entry per row, sharing a single fallback timestamp."""
+
+        generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+        self.entries.extend(self._build_entry(row, generated_at) for row in rows)
+
+    def _build_entry(self, row: IndexRow, generated_at: str) -> IndexEntry:
+        country_info, year, path, feature_count, variant, updated_at = row
         try:
             relative_path = path.relative_to(REPO_ROOT)
         except ValueError:
             relative_path = path
 
-        feature_count = feature_count or infer_feature_count(path)
-        updated_at = updated_at or datetime.utcnow().isoformat(timespec="seconds") + "Z"
-
         entry: IndexEntry = {
             "country": country_info.get("name", country_info.get("iso2")),
             "iso2": country_info.get("iso2"),
@@ -44,12 +61,12 @@ class IndexBuilder:
             "year": year,
             "relative_path": relative_path.as_posix(),
             "file_name": path.name,
-            "feature_count": feature_count,
+            "feature_count": feature_count or infer_feature_count(path),
             "cdn_url": (
                 f"https://cdn.jsdelivr.net/gh/im4sea/ipc-areas@{self.release_tag}/"
                 f"{display_relative(path)}"
             ),
-            "updated_at": updated_at,
+            "updated_at": updated_at or generated_at,
             "variant": variant,
         }
 
@@ -57,12 +74,12 @@ class IndexBuilder:
             for field in ("iso2", "iso3", "year"):
                 entry.pop(field, None)
 
-        self.entries.append(entry)
+        return entry
 
     def write(self) -> None:
         index_path = self.output_dir / "index.json"
         index_payload = {
-            "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
             "cdn_release_tag": self.release_tag,
             "total_files": len(self.entries),
             "items": sorted(
@@ -76,8 +93,6 @@ class IndexBuilder:
             ),
         }
 
-        index_path.parent.mkdir(exist_ok=True, parents=True)
-        with index_path.open("w", encoding="utf-8") as handle:
-            json.dump(index_payload, handle, indent=2)
+        write_json(index_path, index_payload, indent=True)
 
         print(f"Index updated: {display_relative(index_path)}")
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import copy
-from typing import Any, Dict, Iterable, List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from .feature_utils import feature_key
+from .dates import parse_iso_datetime
+from .feature_utils import CACHED_KEY_PROPERTY, feature_key, strip_cached_keys
 
 Feature = Dict[str, Any]
 Aggregated = Dict[str, Dict[str, Any]]
@@ -30,13 +31,21 @@ def merge_features(
         if not isinstance(feature, dict):
             continue
 
-        feature_copy = copy.deepcopy(feature)
+        # Key the original so a memoised hash key survives into later passes.
+        key = feature_key(feature)
+        # Geometry is never mutated downstream, so it is shared with the input;
+        # only the properties, which callers strip before writing, are copied.
+        feature_copy = dict(feature)
+        if isinstance(feature_copy.get("properties"), dict):
+            feature_copy["properties"] = dict(feature_copy["properties"])
         props = feature_copy.get("properties") or {}
-        key = feature_key(feature_copy)
+        candidate_year = props.get("year") if props.get("year") is not None else source_year
         candidate = {
             "feature": feature_copy,
             "priority": priority,
-            "source_year": props.get("year") if props.get("year") is not None else source_year,
+            "source_year": candidate_year,
+            # Primary ordering; analysis dates only break ties (see below).
+            "rank": (priority, candidate_year or 0),
             "source_label": source_label,
             "title": props.get("title"),
             # Extract analysis date info for tie-breaking
@@ -51,17 +60,11 @@ def merge_features(
             stats["added"] += 1
             continue
 
-        replace = False
-        if priority > existing.get("priority", -1):
-            replace = True
-        elif priority == existing.get("priority", -1):
-            candidate_year = candidate.get("source_year") or 0
-            existing_year = existing.get("source_year") or 0
-            if candidate_year > existing_year:
-                replace = True
-            elif candidate_year == existing_year:
-                # When same year and priority, compare analysis dates
-                replace = _should_replace_by_dates(candidate, existing)
+        if candidate["rank"] != existing["rank"]:
+            replace = candidate["rank"] > existing["rank"]
+        else:
+            # When same year and priority, compare analysis dates
+            replace = _should_replace_by_dates(candidate, existing)
 
         if replace:
             aggregate[key] = candidate
@@ -73,48 +76,26 @@ def merge_features(
 
 
 def _should_replace_by_dates(candidate: Dict[str, Any], existing: Dict[str, Any]) -> bool:
-    """Compare analysis dates to determine if candidate should replace existing feature."""
-    from .dates import parse_iso_datetime
-    
-    # Compare 'to' dates first (analysis end date)
-    candidate_to = parse_iso_datetime(candidate.get("to_date"))
-    existing_to = parse_iso_datetime(existing.get("to_date"))
-    
-    if candidate_to and existing_to:
-        if candidate_to > existing_to:
-            return True
-        elif candidate_to < existing_to:
-            return False
-    elif candidate_to and not existing_to:
-        return True
-    elif existing_to and not candidate_to:
-        return False
-    
-    # If 'to' dates are equal or both missing, compare 'from' dates
-    candidate_from = parse_iso_datetime(candidate.get("from_date"))
-    existing_from = parse_iso_datetime(existing.get("from_date"))
-    
-    if candidate_from and existing_from:
-        if candidate_from > existing_from:
-            return True
-        elif candidate_from < existing_from:
-            return False
-    elif candidate_from and not existing_from:
-        return True
-    elif existing_from and not candidate_from:
-        return False
-    
-    # If period dates are equal/missing, compare updated_at timestamps
-    candidate_updated = parse_iso_datetime(candidate.get("updated_at"))
-    existing_updated = parse_iso_datetime(existing.get("updated_at"))
-    
-    if candidate_updated and existing_updated:
-        return candidate_updated > existing_updated
-    elif candidate_updated and not existing_updated:
-        return True
-    
-    # Default: don't replace if we can't determine recency
-    return False
+    """Compare analysis dates to determine if candidate should replace existing feature.
+
+    Dates are compared in order ``to``, ``from``, ``updated_at``; a present
+    date beats a missing one, and a full tie keeps the existing feature.
+    """
+
+    return _recency_key(candidate) > _recency_key(existing)
+
+
+def _recency_key(entry: Dict[str, Any]) -> Tuple[datetime, datetime, datetime]:
+    # Parsed lazily and stored on the entry: most features never tie, while an
+    # entry that does is usually compared against several later candidates.
+    key = entry.get("_recency_key")
+    if key is None:
+        key = tuple(
+            parse_iso_datetime(entry.get(field)) or datetime.min
+            for field in ("to_date", "from_date", "updated_at")
+        )
+        entry["_recency_key"] = key
+    return key
 
 
 def extract_years(aggregate: Aggregated) -> List[int]:
@@ -126,6 +107,21 @@ def extract_years(aggregate: Aggregated) -> List[int]:
     return sorted(years) if years else []
 
 
-def flatten_features(aggregate: Aggregated) -> List[Feature]:
+def flatten_features(aggregate: Aggregated, *, strip_props: Tuple[str, ...] = ()) -> List[Feature]:
+    """Return aggregated features sorted by key, without internal properties.
+
+    ``strip_props`` names extra properties to drop in the same pass.
+    """
+
     sorted_entries = sorted(aggregate.items(), key=lambda item: item[0])
-    return [entry["feature"] for _, entry in sorted_entries]
+    features = [entry["feature"] for _, entry in sorted_entries]
+    if not strip_props:
+        return strip_cached_keys(features)
+
+    drop = (CACHED_KEY_PROPERTY, *strip_props)
+    for feature in features:
+        props = feature.get("properties")
+        if isinstance(props, dict):
+            for name in drop:
+                props.pop(name, None)
+    return features
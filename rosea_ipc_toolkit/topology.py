@@ -4,18 +4,103 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 import topojson as tp
+from topojson.utils import serialize_as_geojson
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json is the fallback encoder
+    orjson = None  # type: ignore[assignment]
 
 from .config import REPO_ROOT
 
 Feature = Dict[str, Any]
 
 
+def parse_json(data: bytes | str) -> Any:
+    """Decode a JSON document with orjson when available.
+
+    Raises ``json.JSONDecodeError`` (which ``orjson.JSONDecodeError`` subclasses)
+    on malformed input, including bytes that are not valid UTF-8.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict about non-standard tokens such as NaN that the
+            # stdlib encoder may have written; let the stdlib parser decide.
+            pass
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as exc:
+        raise json.JSONDecodeError(f"Invalid encoding: {exc.reason}", "", exc.start) from exc
+
+
+def read_json(path: Path) -> Any:
+    """Parse a JSON file, decoding the raw bytes with orjson when available."""
+
+    return parse_json(path.read_bytes())
+
+
+def write_json(path: Path, payload: Any, *, indent: bool = False) -> Path:
+    """Write ``payload`` compactly (or two-space indented) using orjson when available.
+
+    NumPy arrays anywhere in ``payload`` are written as nested lists. Payloads
+    orjson refuses (non-string keys, oversized integers, non-contiguous arrays)
+    fall back to the stdlib encoder. Note that orjson writes NaN/Infinity as
+    ``null``.
+    """
+
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    if orjson is not None:
+        options = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            encoded = orjson.dumps(payload, option=options)
+        except TypeError:
+            pass
+        else:
+            path.write_bytes(encoded)
+            return path
+
+    with path.open("w", encoding="utf-8") as handle:
+        if indent:
+            json.dump(payload, handle, indent=2, default=_json_default)
+        else:
+            json.dump(payload, handle, separators=(",", ":"), default=_json_default)
+
+    return path
+
+
+def _as_plain_json(payload: Any) -> Any:
+    """Return ``payload`` rebuilt from plain JSON types (lists, floats, dicts)."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
+        except TypeError:
+            pass
+    return json.loads(json.dumps(payload, default=_json_default))
+
+
+def _json_default(value: Any) -> Any:
+    # Arcs may be kept as NumPy arrays up to the write; orjson encodes them
+    # natively, the stdlib encoder needs them as lists.
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def convert_geojson_to_topology(geojson: Dict[str, Any]) -> Dict[str, Any]:
     topology = tp.Topology(geojson, prequantize=False)
-    result = topology.to_dict()
+    # Equivalent to ``to_dict()`` minus its deep copy of the output; the
+    # Topology object is discarded, so nothing else sees it.
+    result = topology._resolve_coords(topology.output)
+    result.pop("options", None)
     # Some point-only datasets omit the ``arcs`` array, but downstream tooling
     # (and the topojson library itself when reloading the file) expects the key
     # to exist. Normalise by inserting an empty list so later processes can
@@ -24,6 +109,144 @@ def convert_geojson_to_topology(geojson: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def decode_arcs(topology: Dict[str, Any]) -> List[np.ndarray]:
+    """Return the topology's arcs as absolute ``float64`` arrays.
+
+    Quantized topologies (those with a ``transform``) store delta-encoded
+    integer arcs; these are accumulated and scaled back to coordinates.
+    Raises ``ValueError`` when an arc has inconsistent point dimensions.
+    """
+
+    transform = topology.get("transform")
+    scale = translate = None
+    if isinstance(transform, dict):
+        scale = np.asarray(transform["scale"], dtype=np.float64)
+        translate = np.asarray(transform["translate"], dtype=np.float64)
+
+    decoded: List[np.ndarray] = []
+    for arc in topology.get("arcs") or []:
+        if not arc:
+            decoded.append(np.empty((0, 2), dtype=np.float64))
+            continue
+        array = np.asarray(arc, dtype=np.float64)
+        if array.ndim != 2:
+            raise ValueError("Arc positions must share the same dimensions")
+        if scale is not None:
+            array = np.cumsum(array, axis=0)
+            array[:, :2] = array[:, :2] * scale + translate
+        decoded.append(array)
+    return decoded
+
+
+def encode_arcs(arcs: List[np.ndarray], transform: Dict[str, Any]) -> List[List[List[int]]]:
+    """Quantize absolute arcs onto ``transform``'s grid and delta-encode them."""
+
+    scale = np.asarray(transform["scale"], dtype=np.float64)
+    translate = np.asarray(transform["translate"], dtype=np.float64)
+    lengths = [len(arc) for arc in arcs]
+    if not any(lengths):
+        return [[] for _ in lengths]
+
+    points = np.concatenate([arc[:, :2] for arc in arcs])
+    quantized = np.rint((points - translate) / scale).astype(np.int64)
+    deltas = quantized.copy()
+    deltas[1:] -= quantized[:-1]
+    starts = np.cumsum([0] + lengths[:-1])
+    starts = starts[np.asarray(lengths) > 0]
+    deltas[starts] = quantized[starts]
+
+    flat = deltas.tolist()
+    encoded: List[List[List[int]]] = []
+    start = 0
+    for length in lengths:
+        encoded.append(flat[start : start + length])
+        start += length
+    return encoded
+
+
+def topology_geometries(topology: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the top-level geometries of every object, in feature order."""
+
+    geometries: List[Dict[str, Any]] = []
+    for obj in (topology.get("objects") or {}).values():
+        if not isinstance(obj, dict):
+            continue
+        if obj.get("type") == "GeometryCollection" and isinstance(obj.get("geometries"), list):
+            geometries.extend(obj["geometries"])
+        else:
+            geometries.append(obj)
+    return geometries
+
+
+def merge_topologies(
+    topologies: Sequence[Dict[str, Any]],
+    geometries: Iterable[Tuple[int, Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Concatenate geometries from several topologies into one unquantized topology.
+
+    ``geometries`` yields ``(source index, geometry)`` pairs in output order.
+    Only arcs they reference are kept, re-indexed onto the merged arc list,
+    and geometries are renumbered the way ``topojson`` names features.
+    Quantized sources are decoded to absolute coordinates. Arcs are not
+    shared across sources, so a border between two sources is stored twice.
+    Raises ``ValueError`` for inputs this cannot merge (ragged arcs, or
+    positions in quantized sources).
+    """
+
+    decoded = [
+        decode_arcs(topology) if "transform" in topology else list(topology.get("arcs") or [])
+        for topology in topologies
+    ]
+    merged_arcs: List[Any] = []
+    arc_ids: Dict[Tuple[int, int], int] = {}
+
+    def remap(source: int, ref: Any) -> Any:
+        if isinstance(ref, list):
+            return [remap(source, member) for member in ref]
+        index = ref if ref >= 0 else ~ref
+        new_index = arc_ids.get((source, index))
+        if new_index is None:
+            new_index = arc_ids[(source, index)] = len(merged_arcs)
+            merged_arcs.append(decoded[source][index])
+        return new_index if ref >= 0 else ~new_index
+
+    def remap_geometry(source: int, geometry: Dict[str, Any]) -> Dict[str, Any]:
+        if "coordinates" in geometry and "transform" in topologies[source]:
+            raise ValueError("Quantized point geometries cannot be merged")
+        result = dict(geometry)
+        if "arcs" in result:
+            result["arcs"] = remap(source, result["arcs"])
+        if isinstance(result.get("geometries"), list):
+            result["geometries"] = [remap_geometry(source, member) for member in result["geometries"]]
+        return result
+
+    merged_geometries = [remap_geometry(source, geometry) for source, geometry in geometries]
+    width = len(str(len(merged_geometries)))
+    for position, geometry in enumerate(merged_geometries):
+        geometry["id"] = f"feature_{str(position).zfill(width)}"
+
+    result: Dict[str, Any] = {
+        "type": "Topology",
+        "objects": {"data": {"type": "GeometryCollection", "geometries": merged_geometries}},
+    }
+    points = [np.asarray(arc, dtype=np.float64)[:, :2] for arc in merged_arcs if len(arc)]
+    if points:
+        stacked = np.concatenate(points)
+        result["bbox"] = [*stacked.min(axis=0).tolist(), *stacked.max(axis=0).tolist()]
+    result["arcs"] = merged_arcs
+    return result
+
+
+def iter_arc_indices(arcs: Any) -> Iterator[int]:
+    """Yield the (non-negative) arc indices referenced by a geometry's ``arcs``."""
+
+    if isinstance(arcs, int):
+        yield arcs if arcs >= 0 else ~arcs
+    elif isinstance(arcs, list):
+        for member in arcs:
+            yield from iter_arc_indices(member)
+
+
 def _wrap_point_coordinates(geometry: Dict[str, Any]) -> None:
     geom_type = geometry.get("type")
     if geom_type == "GeometryCollection":
@@ -38,21 +261,37 @@ def _wrap_point_coordinates(geometry: Dict[str, Any]) -> None:
             geometry["coordinates"] = [coords]
 
 
+def _copy_geometry(geometry: Dict[str, Any]) -> Dict[str, Any]:
+    copied = dict(geometry)
+    members = copied.get("geometries")
+    if isinstance(members, list):
+        copied["geometries"] = [_copy_geometry(member) if isinstance(member, dict) else member for member in members]
+    return copied
+
+
 def _wrap_topology_points(payload: Dict[str, Any]) -> Dict[str, Any]:
-    wrapped = json.loads(json.dumps(payload))
+    # Copy only down to the geometry dicts, which the point wrapping (and
+    # topojson's own coordinate resolution) rewrite; arcs and properties stay
+    # shared with ``payload``, which is left unmodified.
+    wrapped = dict(payload)
     if "arcs" not in wrapped:
         wrapped["arcs"] = []
     objects = wrapped.get("objects")
     if not isinstance(objects, dict):
         return wrapped
 
-    for obj in objects.values():
+    wrapped["objects"] = objects = dict(objects)
+    for name, obj in objects.items():
         if not isinstance(obj, dict):
             continue
         geometries = obj.get("geometries")
         if not isinstance(geometries, list):
             continue
-        for geometry in geometries:
+        obj = objects[name] = dict(obj)
+        obj["geometries"] = [
+            _copy_geometry(geometry) if isinstance(geometry, dict) else geometry for geometry in geometries
+        ]
+        for geometry in obj["geometries"]:
             if isinstance(geometry, dict):
                 _wrap_point_coordinates(geometry)
 
@@ -80,12 +319,22 @@ def _restore_point_coordinates(geometry: Dict[str, Any]) -> None:
 
 
 def load_topojson_features(path: Path) -> List[Feature]:
-    with path.open("r", encoding="utf-8") as handle:
-        topo_payload = json.load(handle)
+    return topology_to_features(read_json(path))
+
+
+def topology_to_features(topo_payload: Dict[str, Any]) -> List[Feature]:
+    """Decode a parsed TopoJSON payload to GeoJSON features, leaving it unmodified."""
 
     wrapped_payload = _wrap_topology_points(topo_payload)
     topology = tp.Topology(wrapped_payload, topology=True, prequantize=False)
-    geojson_payload = json.loads(topology.to_geojson())
+    # ``to_geojson`` deep-copies the output and encodes it with the stdlib
+    # encoder only for us to parse it back. The topology is discarded here, so
+    # decode its output in place and normalise shapely's tuples to lists with
+    # a fast encoder round trip instead.
+    topo_object = topology._resolve_coords(topology.output)
+    geojson_payload = _as_plain_json(
+        serialize_as_geojson(topo_object, objectname=topology._resolve_object_name(0))
+    )
 
     features = geojson_payload.get("features") if isinstance(geojson_payload, dict) else None
     if not isinstance(features, list):
@@ -104,11 +353,7 @@ def load_topojson_features(path: Path) -> List[Feature]:
 
 
 def save_topology(topojson_data: Dict[str, Any], path: Path) -> Path:
-    path.parent.mkdir(exist_ok=True, parents=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(topojson_data, handle, separators=(",", ":"))
-
-    return path
+    return write_json(path, topojson_data)
 
 
 def display_relative(path: Path) -> str:
@@ -120,8 +365,7 @@ def display_relative(path: Path) -> str:
 
 def infer_feature_count(path: Path) -> Optional[int]:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = read_json(path)
     except (OSError, json.JSONDecodeError):
         return None
 